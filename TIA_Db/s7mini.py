@@ -143,11 +143,13 @@ class S7Client:
     def db_read(self, db_number: int, start: int, size: int) -> bytearray:
         self.ensure()
         data = self._client.db_read(db_number, start, size)
-        return bytearray(data)
+        # snap7 levert al een nieuwe bytearray; alleen kopiëren als dat niet zo is
+        return data if isinstance(data, bytearray) else bytearray(data)
 
     def db_write(self, db_number: int, start: int, data: bytes | bytearray) -> None:
         self.ensure()
-        self._client.db_write(db_number, start, bytes(data))
+        # snap7 kopieert de data zelf naar een ctypes-buffer; geen extra kopie nodig
+        self._client.db_write(db_number, start, data)
 
 
 # ---------------- Convenience: bitmask lezen/schrijven ----------------
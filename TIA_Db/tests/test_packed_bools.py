@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+import struct
+
+from TIA_Db.type_definitions import AddressInfo
+from TIA_Db.utlis import BufferMapping
+
+
+def _word_get(buf: bytearray, byte_offset: int, bit: int) -> bool:
+    # Reference: the bool is bit `bit` of the little-endian word at `byte_offset`
+    return bool((struct.unpack("<H", buf[byte_offset : byte_offset + 2])[0] >> bit) & 1)
+
+
+def _word_set(buf: bytearray, byte_offset: int, bit: int, value: bool) -> None:
+    word = struct.unpack("<H", buf[byte_offset : byte_offset + 2])[0]
+    word = word | (1 << bit) if value else word & ~(1 << bit)
+    buf[byte_offset : byte_offset + 2] = struct.pack("<H", word)
+
+
+def test_packed_bools_match_word_layout():
+    byte_offset = 2
+    mapping = {f"b{bit}": AddressInfo((byte_offset, bit), "H") for bit in range(16)}
+    rng = random.Random(1200)
+    for _ in range(50):
+        initial = bytearray(rng.randrange(256) for _ in range(6))
+        buf = bytearray(initial)
+        ref = bytearray(initial)
+        db = BufferMapping(buf, mapping)
+
+        for bit in range(16):
+            assert db[f"b{bit}"] == _word_get(ref, byte_offset, bit)
+
+        for bit in rng.sample(range(16), 16):
+            value = rng.random() < 0.5
+            db[f"b{bit}"] = value
+            _word_set(ref, byte_offset, bit, value)
+            assert buf == ref
+            assert db[f"b{bit}"] is value
+
+
+def main() -> int:
+    test_packed_bools_match_word_layout()
+    print("packed bools OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
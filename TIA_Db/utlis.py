@@ -12,6 +12,22 @@ from .type_definitions import AddressInfo, DBField
 
 ElementalType = float | int | bool
 
+# (name, precompiled struct or None for packed bools, byte offset, bit index or None)
+DecodeStep = tuple[str, struct.Struct | None, int, int | None]
+
+# (precompiled struct or None for packed bools, byte offset, bit index)
+Codec = tuple[struct.Struct | None, int, int]
+
+_STRUCTS: dict[str, struct.Struct] = {}
+
+
+def _struct_for(format_char: str) -> struct.Struct:
+    """Return the shared big-endian `struct.Struct` for a single format character."""
+    st = _STRUCTS.get(format_char)
+    if st is None:
+        st = _STRUCTS[format_char] = struct.Struct(f">{format_char}")
+    return st
+
 
 class BufferMapping(UserDict):
     """A mapping that allows for easy access to a buffer of bytes.
@@ -24,36 +40,77 @@ class BufferMapping(UserDict):
         super().__init__()
         self.buffer = buffer
         self.data = mapping
+        self._codecs: dict[str, Codec] = {}
+
+    def _codec(self, name: str) -> Codec:
+        """Resolve the address and struct for `name` once and cache it."""
+        codec = self._codecs.get(name)
+        if codec is None:
+            offset, format_char = self.data[name]
+            if format_char == "H" and isinstance(offset, tuple):
+                byte_offset, bit_position = offset
+                # bools are packed little-endian in a word: bit 8+ lives in the next byte
+                codec = (None, byte_offset + (bit_position >> 3), bit_position & 7)
+            else:
+                codec = (_struct_for(format_char), offset, 0)
+            self._codecs[name] = codec
+        return codec
 
     def __getitem__(self, name: str) -> ElementalType:
-        offset, format_char = self.data[name]
+        st, offset, bit_position = self._codec(name)
 
-        # If the format_char is 'H' and the offset is a tuple, handle the bit-level extraction
-        if format_char == "H" and isinstance(offset, tuple):
-            byte_offset, bit_position = offset
-            value = struct.unpack("<H", self.buffer[byte_offset : byte_offset + 2])[0]
-            return bool((value >> bit_position) & 1)
+        # Packed bools: read the bit straight from its byte
+        if st is None:
+            return bool((self.buffer[offset] >> bit_position) & 1)
         else:
-            size = struct.calcsize(format_char)
-            return struct.unpack(f">{format_char}", self.buffer[offset : offset + size])[0]
+            return st.unpack_from(self.buffer, offset)[0]
 
     def __setitem__(self, name: str, value: ElementalType) -> None:
-        offset, format_char = self.data[name]
-        # If the format_char is 'H' and the offset is a tuple, handle the bit-level assignment
-        if format_char == "H" and isinstance(offset, tuple):
-            byte_offset, bit_position = offset
-            current_value = struct.unpack("<H", self.buffer[byte_offset : byte_offset + 2])[0]
-
-            # Set or clear the bit based on value
+        st, offset, bit_position = self._codec(name)
+        # Packed bools: set or clear the bit in its byte
+        if st is None:
+            mask = 1 << bit_position
             if value:
-                current_value |= 1 << bit_position
+                self.buffer[offset] |= mask
             else:
-                current_value &= ~(1 << bit_position)
-
-            self.buffer[byte_offset : byte_offset + 2] = struct.pack("<H", current_value)
+                self.buffer[offset] &= ~mask & 0xFF
         else:
-            size = struct.calcsize(format_char)
-            self.buffer[offset : offset + size] = struct.pack(f">{format_char}", value)
+            st.pack_into(self.buffer, offset, value)
+
+    def decode_plan(self) -> list[DecodeStep]:
+        """Build a one-time decode plan for all variables in the mapping.
+
+        Every entry carries a precompiled `struct.Struct` so decoding does not
+        have to re-parse the format string per access. Packed bools are stored
+        as a direct (byte, bit) address instead.
+        """
+        plan: list[DecodeStep] = []
+        for name in self.data:
+            st, offset, bit_position = self._codec(name)
+            plan.append((name, st, offset, bit_position if st is None else None))
+        return plan
+
+    def decode_all(self, plan: list[DecodeStep], default=None) -> list[tuple[str, ElementalType]]:
+        """Decode every variable of `plan` from the buffer in one pass.
+
+        Variables that fall outside the buffer are returned as `default`.
+        """
+        buf = self.buffer
+        try:
+            return [
+                (name, bool((buf[off] >> bit) & 1) if st is None else st.unpack_from(buf, off)[0])
+                for name, st, off, bit in plan
+            ]
+        except (IndexError, struct.error):
+            pass
+        values = []
+        for name, st, off, bit in plan:
+            try:
+                val = bool((buf[off] >> bit) & 1) if st is None else st.unpack_from(buf, off)[0]
+            except (IndexError, struct.error):
+                val = default
+            values.append((name, val))
+        return values
 
     def __repr__(self) -> str:
         # return the unpacked values instead of the self.data field
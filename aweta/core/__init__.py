@@ -1,7 +1,7 @@
 """Core functionality for AWETA application."""
 
 from aweta.core.constants import TICK_PX, PORT_R
-from aweta.core.variables import VARS
+from aweta.core.variables import VARS, ensure_var
 
-__all__ = ["TICK_PX", "PORT_R", "VARS"]
+__all__ = ["TICK_PX", "PORT_R", "VARS", "ensure_var"]
 
@@ -6,3 +6,24 @@ TICK_PX = 60
 # Port radius in pixels
 PORT_R = 6
 
+# Simulation frame period in ms (~60 fps); also the fixed simulation step
+FRAME_MS = 16
+
+# Max simulation steps run per timer tick to catch up after a late frame (older backlog is dropped)
+MAX_CATCHUP_STEPS = 4
+
+# Max hidden box items kept for reuse after boxes leave the belts
+BOX_POOL_MAX = 64
+
+
+# Snap7 poll interval bounds in ms (idle polls back off, changes snap back to the minimum).
+# The back-off stops at the default period: PLC commands never arrive later than at a fixed 500 ms.
+POLL_MIN_MS = 100
+POLL_DEFAULT_MS = 500
+POLL_MAX_MS = POLL_DEFAULT_MS
+
+# Unchanged polls before the poll interval is doubled
+POLL_BACKOFF_AFTER = 3
+
+# Minimum time between live DB viewer refreshes in ms (polls in between are coalesced)
+DB_VIEWER_REFRESH_MS = 250
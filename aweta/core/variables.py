@@ -3,3 +3,16 @@
 # Simple variable store (placeholder for external PLC variables)
 VARS: dict[str, bool] = {}
 
+
+def ensure_var(name: str | None, default: bool = False):
+    """Register `name` in VARS with `default` unless it already exists.
+    
+    Empty names (no variable assigned) are ignored.
+    
+    Args:
+        name: Variable name, or None/empty
+        default: Initial value for a new variable
+    """
+    if name:
+        VARS.setdefault(name, default)
+
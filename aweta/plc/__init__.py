@@ -1,7 +1,7 @@
 """PLC connectivity module for AWETA application."""
 
-from aweta.plc.connection import PLCConnection
+from aweta.plc.connection import PLCConnection, Snap7PollSignals, Snap7PollTask
 from aweta.plc.db_viewer import DBViewer
 
-__all__ = ["PLCConnection", "DBViewer"]
+__all__ = ["PLCConnection", "Snap7PollSignals", "Snap7PollTask", "DBViewer"]
 
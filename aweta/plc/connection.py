@@ -1,7 +1,7 @@
 """PLC connection management for AWETA application."""
 
 from typing import Optional
-from PySide6.QtCore import QTimer, QObject, Signal
+from PySide6.QtCore import QTimer, QObject, QRunnable, Signal
 
 try:
     import snap7  # type: ignore
@@ -9,6 +9,48 @@ except ImportError:
     snap7 = None  # type: ignore
 
 
+class Snap7PollSignals(QObject):
+    """Signals emitted by a Snap7PollTask.
+    
+    Create this on the GUI thread so connected slots run there as well.
+    """
+    
+    buffer_ready = Signal(object)
+    failed = Signal(str)
+
+
+class Snap7PollTask(QRunnable):
+    """Read a DB from the PLC on a QThreadPool worker thread."""
+    
+    def __init__(self, client, db_number: int, size: int, signals: Snap7PollSignals):
+        """Initialize the poll task.
+        
+        Args:
+            client: Connected snap7 client (kept alive until the read finishes)
+            db_number: DB number to read
+            size: Number of bytes to read from offset 0
+            signals: Signals object used to report the result
+        """
+        super().__init__()
+        self.client = client
+        self.db_number = db_number
+        self.size = size
+        self.signals = signals
+    
+    def run(self):
+        """Perform the blocking db_read and emit the result."""
+        client = self.client
+        try:
+            if not client.get_connected():
+                self.signals.failed.emit("not connected")
+                return
+            buf = client.db_read(db_number=self.db_number, start=0, size=self.size)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.buffer_ready.emit(buf)
+
+
 class PLCConnection(QObject):
     """Manages connection to a PLC via snap7."""
     
@@ -121,8 +163,8 @@ class PLCConnection(QObject):
                     start=0,
                     size=self.db_block.db_size
                 )
-                # Update buffer in place
-                self.db_block.buffer = bytearray(buf)
+                # snap7 returns a fresh bytearray: adopt it instead of copying it again
+                self.db_block.buffer = buf if isinstance(buf, bytearray) else bytearray(buf)
         except Exception:
             # Keep trying silently
             self.disconnected.emit()
@@ -1,7 +1,9 @@
 """DB viewer for displaying PLC data blocks."""
 
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -13,6 +15,8 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
+from aweta.core.constants import DB_VIEWER_REFRESH_MS
+
 try:
     from rich.console import Console
     from rich.table import Table as RichTable
@@ -25,10 +29,20 @@ try:
 except ImportError:
     TIA_S7DataBlock = None  # type: ignore
 
+log = logging.getLogger(__name__)
+
 
 class DBViewer(QDialog):
     """Dialog for viewing and loading PLC data blocks."""
     
+    # Value formatters keyed on exact type (bool is routed before it could match int)
+    _FMT_DISPATCH: ClassVar[dict] = {
+        bool: lambda v: "True" if v else "False",
+        float: lambda v: f"{v:.4g}",
+        int: str,
+        str: str,
+    }
+    
     def __init__(self, parent=None):
         """Initialize DB viewer.
         
@@ -47,8 +61,12 @@ class DBViewer(QDialog):
         self.btn_load.clicked.connect(self._choose_db_definition)
         self.btn_refresh = QPushButton("Refresh", self)
         self.btn_refresh.clicked.connect(self._refresh_view)
+        self.btn_dump = QPushButton("Naar console", self)
+        self.btn_dump.setEnabled(_RICH_OK)
+        self.btn_dump.clicked.connect(self.dump_db_console)
         toolbar.addWidget(self.btn_load)
         toolbar.addWidget(self.btn_refresh)
+        toolbar.addWidget(self.btn_dump)
         toolbar.addStretch(1)
         layout.addLayout(toolbar)
         
@@ -61,10 +79,26 @@ class DBViewer(QDialog):
         # State
         self.db_block = None
         self.db_definition_path: Optional[str] = None
+        self._decode_plan: list = []
+        self._last_pairs: list = []
+        self._rich_console = Console() if _RICH_OK else None
+        self._file_dlg: Optional[QFileDialog] = None
+        
+        # Live updates are coalesced: at most one tree rebuild per interval
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(DB_VIEWER_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self._refresh_view)
     
     def _choose_db_definition(self):
         """Open file dialog to choose DB definition file."""
-        path, _ = QFileDialog.getOpenFileName(self, "Kies TIA DB (.db)", "", "TIA DB (*.db)")
+        if self._file_dlg is None:
+            self._file_dlg = QFileDialog(self, "Kies TIA DB (.db)", "", "TIA DB (*.db)")
+            self._file_dlg.setFileMode(QFileDialog.ExistingFile)
+        if self._file_dlg.exec() != QDialog.Accepted:
+            return
+        files = self._file_dlg.selectedFiles()
+        path = files[0] if files else ""
         if not path:
             return
         
@@ -81,6 +115,7 @@ class DBViewer(QDialog):
                 nesting_depth_to_skip=1
             )
             self.db_definition_path = path
+            self._decode_plan = self.db_block.decode_plan()
             self._refresh_view()
         except Exception as e:
             QMessageBox.critical(self, "Fout", f"Kon DB niet laden:\n{e}")
@@ -89,42 +124,52 @@ class DBViewer(QDialog):
         """Refresh the tree view with current DB data."""
         if self.db_block is None:
             return
-        
-        self.tree.clear()
-        names = list(getattr(self.db_block, 'data', {}).keys())
-        for name in names:
-            try:
-                val = self.db_block[name]
-            except Exception:
-                val = "?"
-            QTreeWidgetItem(self.tree, [name, self._fmt_val(val)])
-        
-        # Rich to console
-        if _RICH_OK and self.db_block is not None:
+        self._rebuild_tree()
+        # The per-refresh console table is debug output; otherwise use the "Naar console" button
+        if self._last_pairs and log.isEnabledFor(logging.DEBUG):
+            self.dump_db_console()
+    
+    def _rebuild_tree(self):
+        """Decode the DB and rebuild the tree rows; the decoded pairs are kept in _last_pairs."""
+        pairs = self.db_block.decode_all(self._decode_plan, default="?")
+        fmt = self._fmt_val
+        # Build all rows detached and insert them in one go (single relayout/repaint)
+        items = [QTreeWidgetItem([name, fmt(val)]) for name, val in pairs]
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.clear()
+            self.tree.invisibleRootItem().addChildren(items)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        self._last_pairs = pairs
+    
+    def schedule_refresh(self):
+        """Request a refresh for new DB data; bursts of requests result in one refresh."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    def dump_db_console(self):
+        """Print the values shown in the tree as a Rich table on the console."""
+        if self._rich_console is not None and self.db_block is not None:
+            if not self._last_pairs:
+                self._rebuild_tree()
+            pairs = self._last_pairs
+            fmt = self._fmt_val
             try:
-                console = Console()
                 title = f"DB{getattr(self.db_block, 'db_number', '?')} – {Path(self.db_definition_path).name if self.db_definition_path else ''}"
                 tbl = RichTable(title=title)
                 tbl.add_column("Variable", style="bold")
                 tbl.add_column("Value")
-                for name in names:
-                    try:
-                        val = self.db_block[name]
-                    except Exception:
-                        val = "?"
+                for name, val in pairs:
                     style = "green" if isinstance(val, bool) and val else ("red" if isinstance(val, bool) else ("cyan" if isinstance(val, (int, float)) else "white"))
-                    tbl.add_row(name, f"[{style}]{self._fmt_val(val)}[/]")
-                console.print(tbl)
+                    tbl.add_row(name, f"[{style}]{fmt(val)}[/]")
+                self._rich_console.print(tbl)
             except Exception:
                 pass
     
     def _fmt_val(self, v):
         """Format a value for display."""
-        if isinstance(v, bool):
-            return "True" if v else "False"
-        if isinstance(v, float):
-            return f"{v:.4g}"
-        return str(v)
+        return self._FMT_DISPATCH.get(type(v), str)(v)
     
     def get_db_block(self):
         """Get the current DB block.
@@ -141,5 +186,6 @@ class DBViewer(QDialog):
             db_block: DB block to display
         """
         self.db_block = db_block
+        self._decode_plan = db_block.decode_plan() if db_block is not None else []
         self._refresh_view()
 
@@ -1,6 +1,12 @@
 """Project save/load functionality for AWETA application."""
 
+import base64
+import contextlib
+import gzip
+import io
 import json
+import os
+import re
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -9,6 +15,86 @@ try:
 except ImportError:
     TIA_S7DataBlock = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None  # type: ignore
+
+# Write buffer for project files (the 8 KiB default means many small writes for indented JSON)
+_WRITE_BUFFER = 1 << 17
+
+# Project files with this suffix are gzip-compressed; a low level keeps saving fast
+GZIP_SUFFIX = ".gz"
+_GZIP_LEVEL = 3
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Project files with this suffix are stored as msgpack instead of JSON
+SCENE_SUFFIX = ".scene"
+
+# Default labels ("Band 3", "Exit 2") used to continue numbering after a load
+_BELT_NUM_RE = re.compile(r"band (\d+)(?: |$)", re.IGNORECASE)
+_EXIT_NUM_RE = re.compile(r"exit (\d+)(?: |$)", re.IGNORECASE)
+
+
+@contextlib.contextmanager
+def _open_for_write(path: str, binary: bool, compressed: bool, name: str = ""):
+    """Open a project file for writing, optionally through gzip.
+    
+    The file is flushed and fsynced once the caller is done, so a following
+    os.replace never swaps in a file whose data is not on disk yet.
+    
+    Args:
+        path: File to write (may be a temporary name)
+        binary: Yield a bytes stream instead of a text stream
+        compressed: Wrap the file in gzip
+        name: File name for the gzip header; GzipFile stores its basename without ".gz"
+    """
+    if not compressed:
+        if binary:
+            f = open(path, 'wb')
+        else:
+            # json.dump writes one small chunk per token; a large buffer batches them
+            f = open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER)
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        return
+    with open(path, 'wb') as raw:
+        with gzip.GzipFile(filename=name, mode='wb', compresslevel=_GZIP_LEVEL, fileobj=raw) as gz:
+            if binary:
+                yield gz
+            else:
+                with io.TextIOWrapper(gz, encoding='utf-8') as f:
+                    yield f
+        # Closing the GzipFile writes the trailer into raw; sync after that
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def _require_msgpack() -> None:
+    """Raise a readable error when a .scene file is used without msgpack."""
+    if msgpack is None:
+        raise RuntimeError(f"msgpack module niet beschikbaar (nodig voor {SCENE_SUFFIX}-bestanden)")
+
+
+def _saved_num(rec: Dict[str, Any], label: str, pattern: re.Pattern) -> Optional[int]:
+    """Default-label number of a saved node.
+    
+    Reads the stored "num" field; files written before that field existed
+    fall back to parsing the label.
+    """
+    num = rec.get("num")
+    if isinstance(num, int):
+        return num
+    m = pattern.match(label)
+    return int(m.group(1)) if m else None
+
 
 class ProjectManager:
     """Manages project save/load operations."""
@@ -28,66 +114,67 @@ class ProjectManager:
         Returns:
             Dictionary containing project data
         """
-        # Collect belts
+        # Collect belts (nodes are top-level items, so pos() is their scene position)
         belts = []
+        belts_append = belts.append
         id_map = {}
-        for item in view.scene.items():
-            from aweta.tools.belt.belt_item import Belt
-            if isinstance(item, Belt):
-                bid = getattr(item, 'bid', None)
-                if bid is None:
-                    continue
-                id_map[item] = bid
-                x = item.scenePos().x()
-                y = item.scenePos().y()
-                r = item.rect()
-                belts.append({
-                    "id": bid,
-                    "label": item.label,
-                    "x": x, "y": y,
-                    "w": r.width(), "h": r.height(),
-                    "width_ticks": getattr(item, 'width_ticks', 1),
-                    "motor_var": getattr(item, 'motor_var', None),
-                    "ft_in_enabled": getattr(item, 'ft_in_enabled', False),
-                    "ft_in_var": getattr(item, 'ft_in_var', None),
-                    "ft_out_enabled": getattr(item, 'ft_out_enabled', False),
-                    "ft_out_var": getattr(item, 'ft_out_var', None),
-                })
+        for item in view.belts:
+            bid = getattr(item, 'bid', None)
+            if bid is None:
+                continue
+            id_map[item] = bid
+            pos = item.pos()
+            r = item.rect()
+            belts_append({
+                "id": bid,
+                "label": item.label,
+                "x": pos.x(), "y": pos.y(),
+                "w": r.width(), "h": r.height(),
+                "num": item.num,
+                "width_ticks": item.width_ticks,
+                "motor_var": item.motor_var,
+                "ft_in_enabled": item.ft_in_enabled,
+                "ft_in_var": item.ft_in_var,
+                "ft_out_enabled": item.ft_out_enabled,
+                "ft_out_var": item.ft_out_var,
+            })
         
         # Collect exits
         exits = []
-        for item in view.scene.items():
-            from aweta.tools.belt.exit_item import ExitBlock
-            if isinstance(item, ExitBlock):
-                xid = getattr(item, 'xid', None)
-                if xid is None:
-                    continue
-                id_map[item] = xid
-                x = item.scenePos().x()
-                y = item.scenePos().y()
-                r = item.rect()
-                exits.append({
-                    "id": xid,
-                    "label": item.label,
-                    "x": x, "y": y,
-                    "w": r.width(), "h": r.height(),
-                    "ft_in_enabled": getattr(item, 'ft_in_enabled', False),
-                    "ft_in_var": getattr(item, 'ft_in_var', None),
-                    "ft_out_enabled": getattr(item, 'ft_out_enabled', False),
-                    "ft_out_var": getattr(item, 'ft_out_var', None),
-                    "capacity": int(getattr(item, 'capacity', 3)),
-                    "dwell_ms": int(getattr(item, 'dwell_ms', 2000))
-                })
+        exits_append = exits.append
+        for item in view.exits:
+            xid = getattr(item, 'xid', None)
+            if xid is None:
+                continue
+            id_map[item] = xid
+            pos = item.pos()
+            r = item.rect()
+            exits_append({
+                "id": xid,
+                "label": item.label,
+                "x": pos.x(), "y": pos.y(),
+                "w": r.width(), "h": r.height(),
+                "num": item.num,
+                "ft_in_enabled": item.ft_in_enabled,
+                "ft_in_var": item.ft_in_var,
+                "ft_out_enabled": item.ft_out_enabled,
+                "ft_out_var": item.ft_out_var,
+                "capacity": int(item.capacity),
+                "dwell_ms": int(item.dwell_ms)
+            })
         
         # Collect links
+        # The view has exactly one generator; it always gets id 0
+        generator = getattr(view, 'generator', None)
+        if generator is not None:
+            id_map[generator] = 0
+        id_get = id_map.get
         links = []
+        links_append = links.append
         for entry in getattr(view, 'links_data', []):
-            src_obj = entry["src_belt"]
-            dst_obj = entry["dst_belt"]
-            from aweta.tools.belt.box_generator import BoxGenerator
-            src_id = 0 if isinstance(src_obj, BoxGenerator) else id_map.get(src_obj)
-            dst_id = id_map.get(dst_obj)
-            links.append({
+            src_id = id_get(entry["src_belt"])
+            dst_id = id_get(entry["dst_belt"])
+            links_append({
                 "src_id": src_id,
                 "src_port": entry["src_port"],
                 "dst_id": dst_id,
@@ -106,47 +193,88 @@ class ProjectManager:
                 payload["db"] = {
                     "definition_path": db_definition_path,
                     "db_number": int(getattr(db_block, 'db_number', 0)),
-                    "buffer": list(getattr(db_block, 'buffer', bytearray()))
+                    "buffer_b64": base64.b64encode(bytes(getattr(db_block, 'buffer', b""))).decode('ascii')
                 }
         except Exception:
             pass
         
         # Generator info
-        if hasattr(view, 'generator') and view.generator is not None:
+        if generator is not None:
+            gen_pos = generator.pos()
             payload["generator"] = {
-                "interval_ms": view.generator.interval_ms,
-                "x": view.generator.scenePos().x(),
-                "y": view.generator.scenePos().y(),
-                "running": getattr(view.generator, 'running', True)
+                "interval_ms": generator.interval_ms,
+                "x": gen_pos.x(),
+                "y": gen_pos.y(),
+                "running": getattr(generator, 'running', True)
             }
         
         return payload
     
-    def save_to_file(self, path: str, view: Any, db_block: Optional[Any] = None, db_definition_path: Optional[str] = None):
+    def save_to_file(self, path: str, view: Any, db_block: Optional[Any] = None, db_definition_path: Optional[str] = None,
+                     pretty: bool = False):
         """Save project to file.
         
+        Paths ending in GZIP_SUFFIX (e.g. "line.json.gz") are written gzip-compressed;
+        paths ending in SCENE_SUFFIX are written as msgpack (requires the msgpack package).
+        
         Args:
             path: File path to save to
             view: View containing belts, exits, links, etc.
             db_block: Optional DB block to save
             db_definition_path: Optional DB definition file path
+            pretty: Indent the JSON for reading by hand (default: compact, faster to write)
         """
+        binary_scene = path.endswith(SCENE_SUFFIX)
+        if binary_scene:
+            _require_msgpack()
         payload = self.save_project(view, db_block, db_definition_path)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, indent=2)
+        compressed = path.endswith(GZIP_SUFFIX)
+        # Write next to the target and swap it in, so a failed save never leaves a half-written project
+        tmp_path = f"{path}.tmp"
+        try:
+            if binary_scene:
+                with _open_for_write(tmp_path, True, False) as f:
+                    f.write(msgpack.packb(payload, use_bin_type=True))
+            elif orjson is not None:
+                with _open_for_write(tmp_path, True, compressed, os.path.basename(path)) as f:
+                    f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0))
+            else:
+                with _open_for_write(tmp_path, False, compressed, os.path.basename(path)) as f:
+                    if pretty:
+                        json.dump(payload, f, indent=2)
+                    else:
+                        f.write(json.dumps(payload, separators=(',', ':')))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
         self.current_path = path
     
     def load_from_file(self, path: str) -> Dict[str, Any]:
         """Load project from file.
         
+        Gzip-compressed files are recognised by their header, whatever their name;
+        SCENE_SUFFIX files are decoded as msgpack.
+        
         Args:
             path: File path to load from
             
         Returns:
             Dictionary containing project data
         """
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # One whole-file read; both parsers take UTF-8 bytes directly
+        if path.endswith(SCENE_SUFFIX):
+            _require_msgpack()
+            data = msgpack.unpackb(Path(path).read_bytes(), raw=False)
+            self.current_path = path
+            return data
+        raw = Path(path).read_bytes()
+        if raw[:2] == _GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         self.current_path = path
         return data
     
@@ -163,129 +291,157 @@ class ProjectManager:
         from aweta.tools.belt.belt_item import Belt
         from aweta.tools.belt.exit_item import ExitBlock
         from aweta.tools.belt.box_generator import BoxGenerator
+        from aweta.tools.belt.link import LINK_PEN, link_curve
         from aweta.core.constants import TICK_PX
-        from aweta.core.variables import VARS
-        
-        # Reset
-        view.scene.clear()
-        view.links.clear()
-        view.links_data.clear()
-        view.next_belt_id = 1
-        view.next_belt_num = 1
-        view.next_exit_id = 1
-        view.next_exit_num = 1
-        view.generator_blocked = False
-        
-        # Recreate generator
-        gen_data = data.get("generator")
-        view.generator = None
-        if isinstance(gen_data, dict):
-            gx = float(gen_data.get("x", 10.0))
-            gy = float(gen_data.get("y", 10.0))
-            view.generator = BoxGenerator(gx, gy)
-            view.generator.set_interval(int(gen_data.get("interval_ms", 1500)))
-            if bool(gen_data.get("running", True)):
-                view.generator.start()
-            else:
-                view.generator.stop()
-            view.scene.addItem(view.generator)
-        
-        # Recreate belts keeping ids
-        id_to_belt = {}
-        for b in data.get("belts", []):
-            belt = Belt(b["x"], b["y"], b.get("w", TICK_PX), b.get("h", 80), b.get("label", "Band"))
-            belt.resize_for_ticks(int(b.get("width_ticks", 1)))
-            mv = b.get("motor_var")
-            belt.motor_var = mv if mv else None
-            belt.ft_in_enabled = bool(b.get("ft_in_enabled", False))
-            belt.ft_in_var = b.get("ft_in_var") or None
-            belt.ft_out_enabled = bool(b.get("ft_out_enabled", False))
-            belt.ft_out_var = b.get("ft_out_var") or None
-            belt.set_sensors_enabled(belt.ft_in_enabled, belt.ft_out_enabled)
-            for var in (belt.ft_in_var, belt.ft_out_var):
-                if var and var not in VARS:
-                    VARS[var] = False
-            if belt.motor_var and belt.motor_var not in VARS:
-                VARS[belt.motor_var] = False
-            belt.update_sensor_visual()
-            belt.bid = b["id"]
-            id_to_belt[belt.bid] = belt
-            view.scene.addItem(belt)
-            if hasattr(belt, "_rebuild_slots"):
-                belt._rebuild_slots()
-            view.next_belt_id = max(view.next_belt_id, belt.bid + 1)
-            try:
-                if belt.label.lower().startswith("band "):
-                    n = int(belt.label.split(" ")[1])
-                    view.next_belt_num = max(view.next_belt_num, n + 1)
-            except Exception:
-                pass
-        
-        if hasattr(view, 'generator') and view.generator is not None:
-            id_to_belt[0] = view.generator
-        
-        # Recreate exits keeping ids
-        for ex in data.get("exits", []):
-            exitb = ExitBlock(ex["x"], ex["y"], ex.get("w", 180), ex.get("h", 80), ex.get("label", "Exit"))
-            exitb.ft_in_enabled = bool(ex.get("ft_in_enabled", False))
-            exitb.ft_in_var = ex.get("ft_in_var") or None
-            exitb.ft_out_enabled = bool(ex.get("ft_out_enabled", False))
-            exitb.ft_out_var = ex.get("ft_out_var") or None
-            exitb.set_sensors_enabled(exitb.ft_in_enabled, exitb.ft_out_enabled)
-            for var in (exitb.ft_in_var, exitb.ft_out_var):
-                if var and var not in VARS:
-                    VARS[var] = False
-            exitb.apply_capacity(int(ex.get("capacity", 3)))
-            exitb.dwell_ms = int(ex.get("dwell_ms", 2000))
-            exitb.xid = ex["id"]
-            view.scene.addItem(exitb)
-            if hasattr(exitb, "_rebuild_slots"):
-                exitb._rebuild_slots()
-                if hasattr(exitb, "_refresh_fills_from_boxes"):
-                    exitb._refresh_fills_from_boxes()
-                if hasattr(exitb, "_update_timer_text"):
-                    exitb._update_timer_text()
-            id_to_belt[exitb.xid] = exitb
-            view.next_exit_id = max(view.next_exit_id, exitb.xid + 1)
-            try:
-                if exitb.label.lower().startswith("exit "):
-                    n = int(exitb.label.split(" ")[1])
-                    view.next_exit_num = max(view.next_exit_num, n + 1)
-            except Exception:
-                pass
+        from aweta.core.variables import ensure_var
         
-        # Recreate links
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QPen, QPainterPath
-        from PySide6.QtWidgets import QGraphicsPathItem, QGraphicsItem
+        scene = view.scene
+        add_item = scene.addItem
+        belts = view.belts
+        exits = view.exits
+        links_data = view.links_data
         
-        for lk in data.get("links", []):
-            src = id_to_belt.get(lk["src_id"])
-            dst = id_to_belt.get(lk["dst_id"])
-            if not src or not isinstance(dst, (Belt, ExitBlock)):
-                continue
-            s = src.p_out.scenePos()
-            d = dst.p_in.scenePos()
-            from PySide6.QtCore import QPointF
-            p = QPainterPath(s)
-            mid = (s + d) / 2
-            p.cubicTo(QPointF(mid.x(), s.y()), QPointF(mid.x(), d.y()), d)
-            pathItem = QGraphicsPathItem(p)
-            pathItem.setPen(QPen(Qt.darkGreen, 2))
-            pathItem.setFlag(QGraphicsItem.ItemIsSelectable, True)
-            pathItem.setFlag(QGraphicsItem.ItemIsFocusable, True)
-            view.scene.addItem(pathItem)
-            view.links_data.append({
-                "pathItem": pathItem,
-                "src_belt": src,
-                "src_port": lk["src_port"],
-                "dst_belt": dst,
-                "dst_port": lk["dst_port"]
-            })
-        
-        view.refresh_link_tooltips()
-        view.refresh_port_indicators()
-        view._rebuild_downstream()
+        # Rebuild with view repaints and scene signals off; one repaint at the end
+        view.setUpdatesEnabled(False)
+        scene.blockSignals(True)
+        try:
+            # Reset
+            scene.clear()
+            links_data.clear()
+            belts.clear()
+            exits.clear()
+            view.reset_boxes()
+            view.downstream_map = {}
+            view.next_belt_id = 1
+            view.next_belt_num = 1
+            view.next_exit_id = 1
+            view.next_exit_num = 1
+            view.generator_blocked = False
+            view.anim_path = None  # selectionChanged is blocked, so clear() won't reset it
+            
+            # Recreate generator
+            gen_data = data.get("generator")
+            generator = None
+            if isinstance(gen_data, dict):
+                gx = float(gen_data.get("x", 10.0))
+                gy = float(gen_data.get("y", 10.0))
+                generator = BoxGenerator(gx, gy)
+                generator.set_interval(int(gen_data.get("interval_ms", 1500)))
+                if bool(gen_data.get("running", True)):
+                    generator.start()
+                else:
+                    generator.stop()
+                add_item(generator)
+            view.generator = generator
+            
+            # Recreate belts keeping ids
+            belts_data = data.get("belts", [])
+            if belts_data:
+                view.next_belt_id = max(view.next_belt_id, max(b["id"] for b in belts_data) + 1)
+            for b in belts_data:
+                belt = Belt(b["x"], b["y"], b.get("w", TICK_PX), b.get("h", 80), b.get("label", "Band"))
+                belt.resize_for_ticks(int(b.get("width_ticks", 1)))
+                mv = b.get("motor_var")
+                belt.motor_var = mv if mv else None
+                belt.ft_in_enabled = bool(b.get("ft_in_enabled", False))
+                belt.ft_in_var = b.get("ft_in_var") or None
+                belt.ft_out_enabled = bool(b.get("ft_out_enabled", False))
+                belt.ft_out_var = b.get("ft_out_var") or None
+                belt.set_sensors_enabled(belt.ft_in_enabled, belt.ft_out_enabled)
+                for var in (belt.ft_in_var, belt.ft_out_var, belt.motor_var):
+                    ensure_var(var)
+                belt.update_sensor_visual()
+                belt.bid = b["id"]
+                add_item(belt)
+                belts.append(belt)
+                if hasattr(belt, "_rebuild_slots"):
+                    belt._rebuild_slots()
+                belt.num = _saved_num(b, belt.label, _BELT_NUM_RE)
+            belt_nums = [belt.num for belt in belts if belt.num is not None]
+            if belt_nums:
+                view.next_belt_num = max(view.next_belt_num, max(belt_nums) + 1)
+            
+            id_to_belt = {belt.bid: belt for belt in belts}
+            if generator is not None:
+                id_to_belt[0] = generator
+            
+            # Recreate exits keeping ids
+            exits_data = data.get("exits", [])
+            if exits_data:
+                view.next_exit_id = max(view.next_exit_id, max(ex["id"] for ex in exits_data) + 1)
+            for ex in exits_data:
+                exitb = ExitBlock(ex["x"], ex["y"], ex.get("w", 180), ex.get("h", 80), ex.get("label", "Exit"))
+                exitb.ft_in_enabled = bool(ex.get("ft_in_enabled", False))
+                exitb.ft_in_var = ex.get("ft_in_var") or None
+                exitb.ft_out_enabled = bool(ex.get("ft_out_enabled", False))
+                exitb.ft_out_var = ex.get("ft_out_var") or None
+                exitb.set_sensors_enabled(exitb.ft_in_enabled, exitb.ft_out_enabled)
+                for var in (exitb.ft_in_var, exitb.ft_out_var):
+                    ensure_var(var)
+                exitb.apply_capacity(int(ex.get("capacity", 3)))
+                exitb.dwell_ms = int(ex.get("dwell_ms", 2000))
+                exitb.xid = ex["id"]
+                add_item(exitb)
+                exits.append(exitb)
+                if hasattr(exitb, "_rebuild_slots"):
+                    exitb._rebuild_slots()
+                    if hasattr(exitb, "_refresh_fills_from_boxes"):
+                        exitb._refresh_fills_from_boxes()
+                    if hasattr(exitb, "_update_timer_text"):
+                        exitb._update_timer_text()
+                exitb.num = _saved_num(ex, exitb.label, _EXIT_NUM_RE)
+            id_to_belt.update({exitb.xid: exitb for exitb in exits})
+            exit_nums = [exitb.num for exitb in exits if exitb.num is not None]
+            if exit_nums:
+                view.next_exit_num = max(view.next_exit_num, max(exit_nums) + 1)
+            
+            # Recreate links
+            from PySide6.QtWidgets import QGraphicsPathItem, QGraphicsItem
+            
+            # Port scene positions, computed once per node (nodes are only translated at load)
+            port_out_pos = {}
+            port_in_pos = {}
+            for oid, obj in id_to_belt.items():
+                op = obj.pos()
+                ox, oy = op.x(), op.y()
+                if hasattr(obj, 'p_out'):
+                    pp = obj.p_out.pos()
+                    port_out_pos[oid] = (ox + pp.x(), oy + pp.y())
+                if hasattr(obj, 'p_in'):
+                    pp = obj.p_in.pos()
+                    port_in_pos[oid] = (ox + pp.x(), oy + pp.y())
+            
+            links_append = links_data.append
+            for lk in data.get("links", []):
+                src = id_to_belt.get(lk["src_id"])
+                dst = id_to_belt.get(lk["dst_id"])
+                if not src or not isinstance(dst, (Belt, ExitBlock)):
+                    continue
+                src_pos = port_out_pos.get(lk["src_id"])
+                dst_pos = port_in_pos.get(lk["dst_id"])
+                if src_pos is None or dst_pos is None:
+                    continue
+                sx, sy = src_pos
+                dx, dy = dst_pos
+                pathItem = QGraphicsPathItem(link_curve(sx, sy, dx, dy))
+                pathItem.setPen(LINK_PEN)
+                pathItem.setFlag(QGraphicsItem.ItemIsSelectable, True)
+                pathItem.setFlag(QGraphicsItem.ItemIsFocusable, True)
+                pathItem.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+                add_item(pathItem)
+                links_append({
+                    "pathItem": pathItem,
+                    "src_belt": src,
+                    "src_port": lk["src_port"],
+                    "dst_belt": dst,
+                    "dst_port": lk["dst_port"]
+                })
+            # Tooltips, port indicators and the downstream map, before the first repaint
+            view.refresh_links()
+        finally:
+            scene.blockSignals(False)
+            view.setUpdatesEnabled(True)
+            view.viewport().update()
         
         # Restore DB if present
         db_block = None
@@ -302,8 +458,12 @@ class ProjectManager:
                         nesting_depth_to_skip=1
                     )
                     db_definition_path = defp
+                    # "buffer_b64" since base64 storage; "buffer" (int list) in older projects
+                    b64 = dbinfo.get("buffer_b64")
                     buf = dbinfo.get("buffer")
-                    if isinstance(buf, list):
+                    if b64:
+                        db_block.buffer = bytearray(base64.b64decode(b64))
+                    elif isinstance(buf, list):
                         db_block.buffer = bytearray(buf)
         except Exception:
             pass
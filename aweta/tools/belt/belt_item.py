@@ -1,6 +1,6 @@
 """Belt graphics item for conveyor belt simulation."""
 
-from PySide6.QtCore import Qt, QPointF
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPen, QBrush, QPainterPath
 from PySide6.QtWidgets import (
     QGraphicsRectItem,
@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 from aweta.core.constants import TICK_PX
 from aweta.core.variables import VARS
 from aweta.tools.belt.port import Port as BeltPort
+from aweta.tools.belt.style import SENSOR_OFF_BRUSH, SENSOR_ON_BRUSH, title_font
 
 
 class Belt(QGraphicsRectItem):
@@ -37,11 +38,14 @@ class Belt(QGraphicsRectItem):
             QGraphicsItem.ItemIsSelectable
         )
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        # Static look: paint once into a pixmap, re-rasterize only when it changes
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Ports (left/right)
         self.p_in = BeltPort(self, 0, h / 2)
         self.p_out = BeltPort(self, w, h / 2)
         self.label = label
+        self.num: int | None = None  # Number from the default "Band N" label, kept when renamed
         
         # Configurable properties
         self.width_ticks = 1  # default 1 tick wide
@@ -52,7 +56,8 @@ class Belt(QGraphicsRectItem):
         self.ft_in_var: str | None = None
         self.ft_in_state: bool = False
         self.ft_in_item = QGraphicsEllipseItem(-5, -5, 10, 10, self)
-        self.ft_in_item.setBrush(QBrush(Qt.gray))
+        self.ft_in_item.setBrush(SENSOR_OFF_BRUSH)
+        self._ft_in_lit = False
         self.ft_in_item.setPen(QPen(Qt.black, 1))
         self.ft_in_item.setVisible(False)
         
@@ -60,9 +65,12 @@ class Belt(QGraphicsRectItem):
         self.ft_out_var: str | None = None
         self.ft_out_state: bool = False
         self.ft_out_item = QGraphicsEllipseItem(-5, -5, 10, 10, self)
-        self.ft_out_item.setBrush(QBrush(Qt.gray))
+        self.ft_out_item.setBrush(SENSOR_OFF_BRUSH)
+        self._ft_out_lit = False
         self.ft_out_item.setPen(QPen(Qt.black, 1))
         self.ft_out_item.setVisible(False)
+        # (FT In, FT Out) last applied by the view's simulation tick; None forces a re-apply
+        self._sensor_state: tuple[bool, bool] | None = None
         
         # Segmented visuals (inner tray + dividers)
         self.inner_frame = QGraphicsRectItem(self)
@@ -75,6 +83,8 @@ class Belt(QGraphicsRectItem):
         
         # Title label as child item
         self.title_item = QGraphicsSimpleTextItem(self)
+        self.title_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.title_item.setFont(title_font())
         self.title_item.setText(self.label)
         self.title_item.setPos(8, 6)
         
@@ -92,6 +102,7 @@ class Belt(QGraphicsRectItem):
     def resize_for_ticks(self, ticks: int):
         """Resize the belt based on number of ticks."""
         self.width_ticks = max(1, int(ticks))
+        self.last_cell = self.width_ticks - 1  # Cell index watched by FT Out
         r = self.rect()
         new_w = self.width_ticks * TICK_PX
         self.setRect(0, 0, new_w, r.height())
@@ -101,7 +112,19 @@ class Belt(QGraphicsRectItem):
         # Place FT In (left top) and FT Out (right top)
         self.ft_in_item.setPos(6, 8)
         self.ft_out_item.setPos(new_w - 12, 8)
+        # Box geometry inside the middle band: (cell width, band top, band height)
+        self.cell_geom = ((new_w - 16) / self.width_ticks, 28, h - 48)
+        # Left edge (local x) of every cell, indexed by cell number
+        self.cell_x = tuple(8 + i * self.cell_geom[0] for i in range(self.width_ticks))
         self._rebuild_slots()
+        # Boxes already on this belt now map to different cells, and the output port moved
+        sc = self.scene()
+        if sc is not None:
+            for v in sc.views():
+                if hasattr(v, '_rebuild_box_index'):
+                    v._rebuild_box_index()
+                if hasattr(v, '_mark_links_dirty'):
+                    v._mark_links_dirty(self)
     
     def _rebuild_slots(self):
         """Rebuild the visual slot dividers."""
@@ -121,27 +144,30 @@ class Belt(QGraphicsRectItem):
         y2 = r.height() - margin_bottom
         self.inner_frame.setRect(8, y1, r.width() - 16, max(10, y2 - y1))
         
-        # Remove old lines
-        for ln in self.slot_lines:
-            try:
-                self.scene().removeItem(ln)
-            except Exception:
-                pass
-        self.slot_lines = []
+        # Reuse existing divider items; only add or drop the difference
+        needed = self.width_ticks - 1 if self.scene() is not None else 0
+        while len(self.slot_lines) > needed:
+            ln = self.slot_lines.pop()
+            ln.setParentItem(None)
+            if ln.scene() is not None:
+                ln.scene().removeItem(ln)
         
-        if self.scene() is None:
+        if needed == 0:
             return
         
-        if self.width_ticks > 1:
-            cell_w = (r.width() - 16) / self.width_ticks
-            x = 8 + cell_w
-            for _ in range(1, self.width_ticks):
-                path = QPainterPath(QPointF(x, y1))
-                path.lineTo(QPointF(x, y2))
+        cell_w = (r.width() - 16) / self.width_ticks
+        x = 8 + cell_w
+        for i in range(needed):
+            path = QPainterPath()
+            path.moveTo(x, y1)
+            path.lineTo(x, y2)
+            if i < len(self.slot_lines):
+                self.slot_lines[i].setPath(path)
+            else:
                 ln = QGraphicsPathItem(path, self)
                 ln.setPen(QPen(Qt.black, 3))
                 self.slot_lines.append(ln)
-                x += cell_w
+            x += cell_w
     
     def set_sensors_enabled(self, in_enabled: bool, out_enabled: bool):
         """Enable/disable FT In and FT Out sensors."""
@@ -151,6 +177,14 @@ class Belt(QGraphicsRectItem):
         self.ft_out_item.setVisible(self.ft_out_enabled)
         self.update_sensor_visual()
     
+    def resync_sensors(self):
+        """Let the next simulation tick re-apply FT In/Out from box occupancy.
+        
+        Call after writing ft_in_state/ft_out_state outside the simulation
+        (e.g. a test pulse), since the tick only applies changed states.
+        """
+        self._sensor_state = None
+    
     def update_sensor_visual(self):
         """Update sensor visual indicators."""
         # FT In active when a box is in the first tick cell
@@ -158,7 +192,10 @@ class Belt(QGraphicsRectItem):
             return
         if self.ft_in_enabled:
             self.ft_in_item.setVisible(True)
-            self.ft_in_item.setBrush(QBrush(Qt.green if self.ft_in_state else Qt.gray))
+            lit = bool(self.ft_in_state)
+            if lit != self._ft_in_lit:
+                self.ft_in_item.setBrush(SENSOR_ON_BRUSH if lit else SENSOR_OFF_BRUSH)
+                self._ft_in_lit = lit
             if self.ft_in_var is not None:
                 VARS[self.ft_in_var] = bool(self.ft_in_state)
         else:
@@ -167,7 +204,10 @@ class Belt(QGraphicsRectItem):
         # FT Out active when box is in the last tick cell
         if self.ft_out_enabled:
             self.ft_out_item.setVisible(True)
-            self.ft_out_item.setBrush(QBrush(Qt.green if self.ft_out_state else Qt.gray))
+            lit = bool(self.ft_out_state)
+            if lit != self._ft_out_lit:
+                self.ft_out_item.setBrush(SENSOR_ON_BRUSH if lit else SENSOR_OFF_BRUSH)
+                self._ft_out_lit = lit
             if self.ft_out_var is not None:
                 VARS[self.ft_out_var] = bool(self.ft_out_state)
         else:
@@ -186,7 +226,7 @@ class Belt(QGraphicsRectItem):
                 views = sc.views()
                 if views:
                     v = views[0]
-                    if hasattr(v, 'update_all_link_paths'):
-                        v.update_all_link_paths()
+                    if hasattr(v, '_mark_links_dirty'):
+                        v._mark_links_dirty(self)
         return super().itemChange(change, value)
 
@@ -9,6 +9,7 @@ from PySide6.QtWidgets import (
 )
 
 from aweta.tools.belt.port import Port as BeltPort
+from aweta.tools.belt.style import title_font
 
 
 class BoxGenerator(QGraphicsRectItem):
@@ -32,6 +33,8 @@ class BoxGenerator(QGraphicsRectItem):
         self.setBrush(QBrush(Qt.white))
         self.setPen(QPen(Qt.black, 2))
         self.setZValue(-5)
+        # The generator rarely changes; draw it from a device pixmap cache
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Always present, not movable/selectable
         self.setFlag(QGraphicsItem.ItemIsSelectable, False)
@@ -39,6 +42,8 @@ class BoxGenerator(QGraphicsRectItem):
         
         # Title
         self.title = QGraphicsSimpleTextItem(label, self)
+        self.title.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.title.setFont(title_font())
         self.title.setPos(8, 6)
         
         # Output port on the right
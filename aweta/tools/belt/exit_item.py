@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 from aweta.core.constants import TICK_PX
 from aweta.core.variables import VARS
 from aweta.tools.belt.port import Port as BeltPort
+from aweta.tools.belt.style import SENSOR_OFF_BRUSH, SENSOR_ON_BRUSH, title_font
 
 
 class ExitBlock(QGraphicsRectItem):
@@ -37,13 +38,18 @@ class ExitBlock(QGraphicsRectItem):
             QGraphicsItem.ItemIsSelectable
         )
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        # Cached as a device pixmap; redrawn only when the block itself changes
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Only input port (left)
         self.p_in = BeltPort(self, 0, h / 2)
         
         # Title
         self.label = label
+        self.num: int | None = None  # Number from the default "Exit N" label, kept when renamed
         self.title_item = QGraphicsSimpleTextItem(self)
+        self.title_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.title_item.setFont(title_font())
         self.title_item.setText(self.label)
         self.title_item.setPos(8, 6)
         
@@ -52,7 +58,8 @@ class ExitBlock(QGraphicsRectItem):
         self.ft_in_var: str | None = None
         self.ft_in_state: bool = False
         self.ft_in_item = QGraphicsEllipseItem(-5, -5, 10, 10, self)
-        self.ft_in_item.setBrush(QBrush(Qt.gray))
+        self.ft_in_item.setBrush(SENSOR_OFF_BRUSH)
+        self._ft_in_lit = False
         self.ft_in_item.setPen(QPen(Qt.black, 1))
         self.ft_in_item.setVisible(False)
         
@@ -60,7 +67,8 @@ class ExitBlock(QGraphicsRectItem):
         self.ft_out_var: str | None = None
         self.ft_out_state: bool = False
         self.ft_out_item = QGraphicsEllipseItem(-5, -5, 10, 10, self)
-        self.ft_out_item.setBrush(QBrush(Qt.gray))
+        self.ft_out_item.setBrush(SENSOR_OFF_BRUSH)
+        self._ft_out_lit = False
         self.ft_out_item.setPen(QPen(Qt.black, 1))
         self.ft_out_item.setVisible(False)
         
@@ -75,7 +83,9 @@ class ExitBlock(QGraphicsRectItem):
         
         # Countdown label (bottom-right)
         self.timer_text = QGraphicsSimpleTextItem("", self)
+        self.timer_text.setFont(title_font())
         self.timer_text.setVisible(False)
+        self._timer_key = None
         
         # Segmented tray visuals
         self.inner_frame = QGraphicsRectItem(self)
@@ -108,7 +118,10 @@ class ExitBlock(QGraphicsRectItem):
         if self.ft_in_enabled:
             self.ft_in_state = (len(self.slots) > 0 and self.slots[0] is not None)
             self.ft_in_item.setVisible(True)
-            self.ft_in_item.setBrush(QBrush(Qt.green if self.ft_in_state else Qt.gray))
+            lit = bool(self.ft_in_state)
+            if lit != self._ft_in_lit:
+                self.ft_in_item.setBrush(SENSOR_ON_BRUSH if lit else SENSOR_OFF_BRUSH)
+                self._ft_in_lit = lit
             if self.ft_in_var:
                 VARS[self.ft_in_var] = bool(self.ft_in_state)
         else:
@@ -118,7 +131,10 @@ class ExitBlock(QGraphicsRectItem):
         if self.ft_out_enabled:
             self.ft_out_state = (len(self.slots) > 0 and self.slots[-1] is not None)
             self.ft_out_item.setVisible(True)
-            self.ft_out_item.setBrush(QBrush(Qt.green if self.ft_out_state else Qt.gray))
+            lit = bool(self.ft_out_state)
+            if lit != self._ft_out_lit:
+                self.ft_out_item.setBrush(SENSOR_ON_BRUSH if lit else SENSOR_OFF_BRUSH)
+                self._ft_out_lit = lit
             if self.ft_out_var:
                 VARS[self.ft_out_var] = bool(self.ft_out_state)
         else:
@@ -132,9 +148,14 @@ class ExitBlock(QGraphicsRectItem):
             return
         rem_ms = max(0, int(self.dwell_ms) - int(last.get("elapsed", 0)))
         txt = f"{rem_ms / 1000.0:.1f}s"
+        r = self.rect()
+        # Shown with 0.1 s resolution: most ticks produce the same text at the same place
+        key = (txt, r.width(), r.height())
+        if key == self._timer_key and self.timer_text.isVisible():
+            return
+        self._timer_key = key
         self.timer_text.setText(txt)
         br = self.timer_text.boundingRect()
-        r = self.rect()
         margin = 6
         self.timer_text.setPos(r.width() - br.width() - margin, r.height() - br.height() - margin)
         self.timer_text.setVisible(True)
@@ -181,8 +202,9 @@ class ExitBlock(QGraphicsRectItem):
         if cells > 1:
             x = inner_x + cell_w
             for _ in range(1, cells):
-                path = QPainterPath(QPointF(x, band_top))
-                path.lineTo(QPointF(x, band_bottom))
+                path = QPainterPath()
+                path.moveTo(x, band_top)
+                path.lineTo(x, band_bottom)
                 ln = QGraphicsPathItem(path, self)
                 ln.setPen(QPen(Qt.black, 3))
                 self.slot_lines.append(ln)
@@ -294,8 +316,8 @@ class ExitBlock(QGraphicsRectItem):
                 views = sc.views()
                 if views:
                     v = views[0]
-                    if hasattr(v, 'update_all_link_paths'):
-                        v.update_all_link_paths()
+                    if hasattr(v, '_mark_links_dirty'):
+                        v._mark_links_dirty(self)
         return super().itemChange(change, value)
     
     def tick(self, dt_ms: int):
@@ -307,6 +329,9 @@ class ExitBlock(QGraphicsRectItem):
         if not self.slots:
             return
         
+        # Track whether occupancy changed; fills and sensors only need a refresh then
+        dirty = False
+        
         # Dwell timer for rightmost slot
         last = self.slots[-1] if self.slots else None
         if last is not None:
@@ -314,6 +339,7 @@ class ExitBlock(QGraphicsRectItem):
             if last["elapsed"] >= int(self.dwell_ms):
                 # Remove rightmost box
                 self.slots[-1] = None
+                dirty = True
         
         # Accumulate advance and shift boxes one cell to the right when due
         self._adv_accum += int(dt_ms)
@@ -324,8 +350,11 @@ class ExitBlock(QGraphicsRectItem):
                 if self.slots[i] is not None and self.slots[i + 1] is None:
                     self.slots[i + 1] = self.slots[i]
                     self.slots[i] = None
+                    dirty = True
         
-        self._refresh_fills_from_boxes()
-        self.update_sensor_visual()
-        self._update_timer_text()
-
+        if dirty:
+            self._refresh_fills_from_boxes()
+            self.update_sensor_visual()
+        # The countdown changes every tick while the rightmost slot is occupied
+        if dirty or last is not None:
+            self._update_timer_text()
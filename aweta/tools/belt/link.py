@@ -4,6 +4,34 @@ from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QPen, QPainterPath
 from PySide6.QtWidgets import QGraphicsPathItem
 
+# Pen shared by every link item (and the rubber link); never mutate it
+LINK_PEN = QPen(Qt.darkGreen, 2)
+
+
+def link_curve(sx: float, sy: float, dx: float, dy: float, path: QPainterPath = None) -> QPainterPath:
+    """Build the S-shaped bezier curve used for links.
+    
+    Both control points sit halfway between start and end, at the start and
+    end height respectively. Works on plain floats so no QPointF wrappers are
+    created per call.
+    
+    Args:
+        sx, sy: Start point in scene coordinates
+        dx, dy: End point in scene coordinates
+        path: Optional path to clear and reuse instead of allocating a new one
+        
+    Returns:
+        The curve as a QPainterPath
+    """
+    if path is None:
+        path = QPainterPath()
+    else:
+        path.clear()
+    mx = 0.5 * (sx + dx)
+    path.moveTo(sx, sy)
+    path.cubicTo(mx, sy, mx, dy, dx, dy)
+    return path
+
 
 class RubberLink(QGraphicsPathItem):
     """Temporary link shown while connecting tools."""
@@ -15,8 +43,9 @@ class RubberLink(QGraphicsPathItem):
             start_pos: Starting position of the link
         """
         super().__init__()
-        self.setPen(QPen(Qt.darkGreen, 2))
+        self.setPen(LINK_PEN)
         self.start = start_pos
+        self._path = QPainterPath()  # reused on every mouse move
         self.update_to(start_pos)
     
     def update_to(self, end_pos: QPointF):
@@ -25,10 +54,6 @@ class RubberLink(QGraphicsPathItem):
         Args:
             end_pos: Ending position of the link
         """
-        path = QPainterPath(self.start)
-        # Simple bezier curve
-        mid = (self.start + end_pos) / 2
-        ctrl = QPointF(mid.x(), self.start.y())
-        path.cubicTo(ctrl, QPointF(mid.x(), end_pos.y()), end_pos)
-        self.setPath(path)
-
+        start = self.start
+        self._path = link_curve(start.x(), start.y(), end_pos.x(), end_pos.y(), self._path)
+        self.setPath(self._path)
@@ -24,4 +24,6 @@ class Port(QGraphicsEllipseItem):
         self.setPos(dx, dy)
         self.setZValue(10)
         self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges, True)
+        # (linked, tooltip) last applied by the view's port indicator refresh
+        self._indicator: tuple[bool, str] | None = None
 
@@ -0,0 +1,26 @@
+"""Shared drawing styles for belt, exit and generator items."""
+
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QFont
+
+# Sensor indicator brushes, shared by all instances
+SENSOR_ON_BRUSH = QBrush(Qt.green)
+SENSOR_OFF_BRUSH = QBrush(Qt.gray)
+
+_title_font: Optional[QFont] = None
+
+
+def title_font() -> QFont:
+    """Shared font for node titles and the exit countdown.
+
+    Built on first use: a QFont made before the QApplication exists has no
+    family or size, and this module is imported before the app is created.
+    Grayscale antialiasing keeps cached glyphs valid on any background.
+    """
+    global _title_font
+    if _title_font is None:
+        _title_font = QFont()
+        _title_font.setStyleStrategy(QFont.StyleStrategy(QFont.PreferAntialias | QFont.NoSubpixelAntialias))
+    return _title_font
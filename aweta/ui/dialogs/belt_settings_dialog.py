@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from aweta.core.constants import TICK_PX
-from aweta.core.variables import VARS
+from aweta.core.variables import VARS, ensure_var
 from aweta.tools.belt.belt_item import Belt
 
 
@@ -115,8 +115,7 @@ class BeltSettingsDialog(QDialog):
         else:
             self.belt.motor_var = (self.le_motor.text().strip() or None)
         
-        if self.belt.motor_var and self.belt.motor_var not in VARS:
-            VARS[self.belt.motor_var] = False
+        ensure_var(self.belt.motor_var)
         
         self.belt.set_sensors_enabled(self.cb_ft_in.isChecked(), self.cb_ft_out.isChecked())
         
@@ -128,10 +127,10 @@ class BeltSettingsDialog(QDialog):
             self.belt.ft_out_var = (self.le_ft_out.text().strip() or None)
         
         for var in (self.belt.ft_in_var, self.belt.ft_out_var):
-            if var and var not in VARS:
-                VARS[var] = False
+            ensure_var(var)
         
         self.belt.update_sensor_visual()
+        self.belt.resync_sensors()
         self.accept()
     
     def _on_test(self):
@@ -159,6 +158,7 @@ class BeltSettingsDialog(QDialog):
                 if self.belt.ft_out_var:
                     VARS[self.belt.ft_out_var] = False
             self.belt.update_sensor_visual()
+            self.belt.resync_sensors()
         
         QTimer.singleShot(300, _sensor_off)
 
@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QComboBox,
 )
 
-from aweta.core.variables import VARS
+from aweta.core.variables import ensure_var
 from aweta.tools.belt.exit_item import ExitBlock
 
 
@@ -116,8 +116,7 @@ class ExitSettingsDialog(QDialog):
             self.exit_block.ft_out_var = (self.le_ft_out.text().strip() or None)
         
         for var in (self.exit_block.ft_in_var, self.exit_block.ft_out_var):
-            if var and var not in VARS:
-                VARS[var] = False
+            ensure_var(var)
         
         self.exit_block.update_sensor_visual()
         self.accept()
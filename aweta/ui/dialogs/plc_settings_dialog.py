@@ -60,6 +60,18 @@ class PLCSettingsDialog(QDialog):
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
     
+    def set_settings(self, plc_ip: str, plc_rack: int, plc_slot: int):
+        """Load settings into the fields (used when the dialog is reopened).
+        
+        Args:
+            plc_ip: PLC IP address
+            plc_rack: PLC rack number
+            plc_slot: PLC slot number
+        """
+        self.ip_edit.setText(plc_ip)
+        self.sp_rack.setValue(int(plc_rack))
+        self.sp_slot.setValue(int(plc_slot))
+    
     def get_settings(self) -> tuple[str, int, int]:
         """Get the configured settings.
         
@@ -4,7 +4,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool
 from PySide6.QtGui import QBrush, QPen
 from PySide6.QtWidgets import (
     QApplication,
@@ -40,14 +40,20 @@ try:
 except ImportError:
     _RICH_OK = False
 
-from aweta.core.constants import TICK_PX
+from aweta.core.constants import (
+    TICK_PX,
+    POLL_MIN_MS,
+    POLL_DEFAULT_MS,
+    POLL_MAX_MS,
+    POLL_BACKOFF_AFTER,
+)
 from aweta.core.variables import VARS
-from aweta.tools.belt.belt_item import Belt
 from aweta.tools.belt.exit_item import ExitBlock
 from aweta.tools.belt.box_generator import BoxGenerator
 from aweta.ui.view import View
 from aweta.ui.dialogs.toolbox_dialog import ToolboxDialog
 from aweta.ui.dialogs.plc_settings_dialog import PLCSettingsDialog
+from aweta.plc.connection import Snap7PollSignals, Snap7PollTask
 from aweta.plc.db_viewer import DBViewer
 from aweta.project.manager import ProjectManager
 
@@ -136,11 +142,25 @@ class MainWindow(QMainWindow):
         # DB / Snap7 state
         self.db_block = None
         self.db_definition_path: Optional[str] = None
+        self._decode_plan: list = []
+        self._db_names_sorted: list[str] = []
+        # Last DB contents read from the PLC and the (name, bool) pairs decoded from them
+        self._last_buf: Optional[bytes] = None
+        self._db_vars: list[tuple[str, bool]] = []
         self._db_dialog: Optional[QDialog] = None
         self._db_tree = None
         self._snap_client = None
         self._snap_timer = QTimer(self)
+        self._snap_timer.setSingleShot(True)
         self._snap_timer.timeout.connect(self._poll_snap7)
+        self._poll_interval_ms = POLL_DEFAULT_MS
+        self._poll_misses = 0
+        # Blocking db_read runs on a single worker (the snap7 client is not reentrant)
+        self._snap_pool = QThreadPool(self)
+        self._snap_pool.setMaxThreadCount(1)
+        self._snap_signals = Snap7PollSignals(self)
+        self._snap_signals.buffer_ready.connect(self._on_snap_buffer)
+        self._snap_signals.failed.connect(self._on_snap_failed)
         
         # PLC connection parameters
         self.plc_ip = "192.168.241.191"
@@ -152,11 +172,16 @@ class MainWindow(QMainWindow):
         
         # DB viewer instance
         self._db_viewer: Optional[DBViewer] = None
+        
+        # Dialogs created on first use and reused afterwards
+        self._plc_dialog: Optional[PLCSettingsDialog] = None
+        self._open_dlg: Optional[QFileDialog] = None
+        self._save_dlg: Optional[QFileDialog] = None
     
     def all_belts_on(self):
         """Set all belts' motor_var to True."""
-        for item in self.view.scene.items():
-            if isinstance(item, Belt) and item.motor_var:
+        for item in self.view.belts:
+            if item.motor_var:
                 VARS[item.motor_var] = True
     
     def gen_start(self):
@@ -200,12 +225,7 @@ class MainWindow(QMainWindow):
         Returns:
             QComboBox if DB variables available, else QLineEdit
         """
-        names = []
-        if self.db_block is not None and hasattr(self.db_block, 'data'):
-            try:
-                names = sorted(list(self.db_block.data.keys()))
-            except Exception:
-                names = []
+        names = self._db_names_sorted
         if names:
             cmb = QComboBox(parent)
             cmb.setEditable(True)
@@ -253,7 +273,11 @@ class MainWindow(QMainWindow):
     
     def open_plc_settings(self):
         """Open PLC settings dialog."""
-        dlg = PLCSettingsDialog(self, self.plc_ip, self.plc_rack, self.plc_slot)
+        dlg = self._plc_dialog
+        if dlg is None:
+            dlg = self._plc_dialog = PLCSettingsDialog(self, self.plc_ip, self.plc_rack, self.plc_slot)
+        else:
+            dlg.set_settings(self.plc_ip, self.plc_rack, self.plc_slot)
         if dlg.exec() == QDialog.Accepted:
             self.plc_ip, self.plc_rack, self.plc_slot = dlg.get_settings()
     
@@ -274,6 +298,10 @@ class MainWindow(QMainWindow):
                 self.lbl_status.setText("Snap7: Not connected")
                 return
         
+        # A poll may still be reading on this client, which is not reentrant: let it finish first
+        self._snap_timer.stop()
+        self._snap_pool.waitForDone()
+        
         # Attempt connect
         ok = False
         try:
@@ -285,57 +313,108 @@ class MainWindow(QMainWindow):
         
         if ok:
             self.lbl_status.setText("Snap7: Connected")
+            self._last_buf = None
             if not self._snap_timer.isActive():
-                self._snap_timer.start(500)
+                self._poll_interval_ms = POLL_DEFAULT_MS
+                self._poll_misses = 0
+                self._snap_timer.start(self._poll_interval_ms)
         else:
             self.lbl_status.setText("Snap7: Not connected")
             if self._snap_timer.isActive():
                 self._snap_timer.stop()
     
     def _poll_snap7(self):
-        """Poll PLC for data updates."""
-        if self._snap_client is None or self.db_block is None:
+        """Poll PLC for data updates.
+        
+        The read itself runs on the worker pool; if the previous read is
+        still pending (e.g. a PLC timeout) this poll is skipped.
+        """
+        if self._snap_client is None:
             return
+        if self.db_block is None:
+            # Nothing to read yet; check again once a project/DB is loaded
+            self._snap_timer.start(self._poll_interval_ms)
+            return
+        self._snap_pool.tryStart(Snap7PollTask(
+            self._snap_client,
+            self.db_block.db_number,
+            self.db_block.db_size,
+            self._snap_signals,
+        ))
+    
+    def _on_snap_buffer(self, buf):
+        """Apply a DB buffer read by the poll worker.
+        
+        Args:
+            buf: Raw DB contents returned by db_read
+        """
+        self.lbl_status.setText("Snap7: Connected")
+        if self.db_block is None or len(buf) != self.db_block.db_size:
+            self._schedule_poll(changed=False)
+            return
+        # Unchanged DB contents: skip decode and viewer refresh, but re-assert the
+        # decoded values so the PLC stays authoritative over local writes
+        if self._last_buf is not None and buf == self._last_buf:
+            VARS.update(self._db_vars)
+            self._schedule_poll(changed=False)
+            return
+        self._last_buf = bytes(buf)
+        self._schedule_poll(changed=True)
+        # snap7 already hands back a bytearray: adopt it as-is. Other buffer types
+        # (bytes, memoryview) are copied into the existing buffer, which has the same size.
+        if isinstance(buf, bytearray):
+            self.db_block.buffer = buf
+        else:
+            self.db_block.buffer[:] = memoryview(buf)
+        # Update global VARS from parsed DB variables
         try:
-            if not self._snap_client.get_connected():
-                self.lbl_status.setText("Snap7: Not connected")
-                return
-            self.lbl_status.setText("Snap7: Connected")
-            if self._snap_client.get_connected():
-                buf = self._snap_client.db_read(
-                    db_number=self.db_block.db_number,
-                    start=0,
-                    size=self.db_block.db_size
-                )
-                # Update buffer in place
-                self.db_block.buffer = bytearray(buf)
-                # Update global VARS from parsed DB variables
-                try:
-                    for name in list(getattr(self.db_block, 'data', {}).keys()):
-                        try:
-                            val = self.db_block[name]
-                            # Normalize to boolean for motor/sensor flags
-                            VARS[name] = bool(val)
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
-                # Live refresh if dialog open
-                if self._db_viewer is not None and self._db_viewer.isVisible():
-                    self._db_viewer._refresh_view()
+            # Normalize to boolean for motor/sensor flags
+            self._db_vars = [(name, bool(val)) for name, val in self.db_block.decode_all(self._decode_plan)]
         except Exception:
-            # Keep trying silently
-            self.lbl_status.setText("Snap7: Not connected")
+            self._db_vars = []
+        VARS.update(self._db_vars)
+        # Live refresh if dialog open (throttled by the viewer)
+        if self._db_viewer is not None and self._db_viewer.isVisible():
+            self._db_viewer.schedule_refresh()
+    
+    def _on_snap_failed(self, msg: str):
+        """Handle a failed poll; keep trying silently.
+        
+        Args:
+            msg: Error description from the poll worker
+        """
+        self.lbl_status.setText("Snap7: Not connected")
+        self._schedule_poll(changed=False)
+    
+    def _schedule_poll(self, changed: bool):
+        """Schedule the next Snap7 poll with adaptive backoff.
+        
+        A changed DB resets the interval to POLL_MIN_MS; every POLL_BACKOFF_AFTER
+        unchanged polls double it, up to POLL_MAX_MS.
+        
+        Args:
+            changed: Whether the last poll returned new DB contents
+        """
+        if changed:
+            self._poll_interval_ms = POLL_MIN_MS
+            self._poll_misses = 0
+        else:
+            self._poll_misses += 1
+            if self._poll_misses >= POLL_BACKOFF_AFTER:
+                self._poll_interval_ms = min(POLL_MAX_MS, self._poll_interval_ms * 2)
+                self._poll_misses = 0
+        if self._snap_client is not None:
+            self._snap_timer.start(self._poll_interval_ms)
     
     def new_project(self):
         """Create a new project."""
         # Clear scene
         self.view.scene.clear()
         # Reset runtime containers
-        self.view.links.clear()
         self.view.links_data.clear()
-        if hasattr(self.view, 'boxes'):
-            self.view.boxes.clear()
+        self.view.belts.clear()
+        self.view.exits.clear()
+        self.view.reset_boxes()
         # Reset counters
         self.view.next_belt_id = 1
         self.view.next_belt_num = 1
@@ -358,17 +437,35 @@ class MainWindow(QMainWindow):
     
     def save_project_as(self):
         """Save project to file."""
-        path, _ = QFileDialog.getSaveFileName(self, "Project opslaan", "", "Conveyor Project (*.json)")
-        if not path:
+        if self._save_dlg is None:
+            self._save_dlg = QFileDialog(self, "Project opslaan", "", "Conveyor Project (*.json *.json.gz *.scene)")
+            self._save_dlg.setAcceptMode(QFileDialog.AcceptSave)
+            self._save_dlg.setFileMode(QFileDialog.AnyFile)
+        if self._save_dlg.exec() != QDialog.Accepted:
+            return
+        files = self._save_dlg.selectedFiles()
+        if not files or not files[0]:
             return
-        self.save_to_path(path)
+        try:
+            self.save_to_path(files[0])
+        except RuntimeError as e:
+            QMessageBox.critical(self, "Fout", str(e))
     
     def open_project(self):
         """Open project from file."""
-        path, _ = QFileDialog.getOpenFileName(self, "Project openen", "", "Conveyor Project (*.json)")
-        if not path:
+        if self._open_dlg is None:
+            self._open_dlg = QFileDialog(self, "Project openen", "", "Conveyor Project (*.json *.json.gz *.scene)")
+            self._open_dlg.setAcceptMode(QFileDialog.AcceptOpen)
+            self._open_dlg.setFileMode(QFileDialog.ExistingFile)
+        if self._open_dlg.exec() != QDialog.Accepted:
+            return
+        files = self._open_dlg.selectedFiles()
+        if not files or not files[0]:
             return
-        self.load_from_path(path)
+        try:
+            self.load_from_path(files[0])
+        except RuntimeError as e:
+            QMessageBox.critical(self, "Fout", str(e))
     
     def save_to_path(self, path: str):
         """Save project to path using ProjectManager."""
@@ -385,14 +482,14 @@ class MainWindow(QMainWindow):
         if db_block is not None:
             self.db_block = db_block
             self.db_definition_path = db_definition_path
+            self._decode_plan = db_block.decode_plan()
+            self._db_names_sorted = sorted(db_block.data)
+            self._last_buf = None
             if self._db_viewer is not None:
                 self._db_viewer.set_db_block(db_block)
         
         self.current_path = path
         self.setWindowTitle(f"Conveyor UI – {path}")
-        self.view.refresh_link_tooltips()
-        self.view.refresh_port_indicators()
-        self.view._rebuild_downstream()
 
 
 def main():
@@ -1,6 +1,8 @@
 """View class for conveyor belt simulation canvas."""
 
-from PySide6.QtCore import Qt, QPointF, QTimer
+import time
+
+from PySide6.QtCore import Qt, QPointF, QRectF, QTimer
 from PySide6.QtGui import QPen, QBrush, QPainterPath
 from PySide6.QtWidgets import (
     QGraphicsView,
@@ -13,16 +15,49 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 
-from aweta.core.constants import TICK_PX
+from aweta.core.constants import BOX_POOL_MAX, FRAME_MS, MAX_CATCHUP_STEPS, TICK_PX
 from aweta.core.variables import VARS
 from aweta.tools.belt.belt_item import Belt
 from aweta.tools.belt.exit_item import ExitBlock
 from aweta.tools.belt.box_generator import BoxGenerator
 from aweta.tools.belt.port import Port as BeltPort
-from aweta.tools.belt.link import RubberLink
+from aweta.tools.belt.link import LINK_PEN, RubberLink, link_curve
 from aweta.ui.dialogs.belt_settings_dialog import BeltSettingsDialog
 from aweta.ui.dialogs.exit_settings_dialog import ExitSettingsDialog
 
+# Fill and outline shared by every spawned box
+_BOX_BRUSH = QBrush(Qt.blue)
+_BOX_PEN = QPen(Qt.black, 1)
+# Belt fill while its motor runs / stands still
+_MOTOR_ON_BRUSH = QBrush(Qt.white)
+_MOTOR_OFF_BRUSH = QBrush(Qt.darkGray)
+# Port fill when linked / open
+_PORT_LINKED_BRUSH = QBrush(Qt.green)
+_PORT_OPEN_BRUSH = QBrush(Qt.white)
+# Outline of a selected link (unselected links use LINK_PEN)
+_LINK_SELECTED_PEN = QPen(Qt.blue, 3, Qt.DashLine)
+
+
+class LineBox:
+    """A box travelling over the belt line.
+
+    Attributes:
+        item: Scene item drawn for the box.
+        belt: Belt the box is currently on.
+        t: Position along the belt (0..1).
+        cell: Cell index derived from `t`, kept in sync by the view.
+        geom: Last (x, y, w, h) applied to `item`, or None before the first layout.
+    """
+    
+    __slots__ = ("item", "belt", "t", "cell", "geom")
+    
+    def __init__(self, item: QGraphicsRectItem, belt: Belt, t: float = 0.0):
+        self.item = item
+        self.belt = belt
+        self.t = t
+        self.cell = 0
+        self.geom = None
+
 
 class View(QGraphicsView):
     """Graphics view for conveyor belt simulation."""
@@ -31,8 +66,16 @@ class View(QGraphicsView):
         """Initialize the view."""
         super().__init__()
         self.setRenderHints(self.renderHints() | self.renderHints().Antialiasing)
+        # Only stock items that set their own pen/brush and stay inside their
+        # bounding rect are drawn, so the per-item painter save/restore and the
+        # 2 px antialiasing margin on exposed areas can be skipped
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.scene = QGraphicsScene(self)
+        # Boxes move every frame, so a BSP index would be rebuilt constantly.
+        # Without an index, hit tests (clicks, link drops) scan all items, which
+        # is cheap at user-event rate.
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         self.setSceneRect(0, 0, 1600, 900)
         
@@ -44,15 +87,19 @@ class View(QGraphicsView):
         self.next_exit_id = 1
         self.next_exit_num = 1
         
+        # Registries of belts/exits on the canvas (avoids filtering scene.items())
+        self.belts: list[Belt] = []
+        self.exits: list[ExitBlock] = []
+        
         # Demo belts (optional - can be removed)
         self.b1 = self.add_belt(60, 60)
         self.b2 = self.add_belt(380, 180)
         self.b3 = self.add_belt(120, 300, 260, 60, "Band 3")
         
         self.rubber = None
-        self.links = []  # List of (pathItem, srcPort, dstPort)
-        self.links_data = []  # Dicts with ids/roles for save/load
-        self.downstream = []  # List of (src_obj, dst_belt)
+        self.links_data = []  # Dicts with path item, endpoints and port roles
+        self.downstream_map: dict = {}  # src_obj -> [dst_obj, ...] in link order
+        self._dirty_links: set = set()  # Nodes whose link paths need a rebuild
         
         # React to selection changes (for link highlight + red-dot attach)
         self.scene.selectionChanged.connect(self.on_selection_changed)
@@ -61,9 +108,14 @@ class View(QGraphicsView):
         self.sim_speed = 1.0
         
         # Timer for animation
+        # Precise timer: Qt keeps the period on schedule (a late tick shortens the
+        # wait for the next one) instead of allowing coarse 5% drift per frame
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.tick)
-        self.timer.start(16)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._on_frame)
+        self._accum_ms = 0.0  # Real time not yet consumed by simulation steps
+        self._last_perf = time.perf_counter()
+        self.timer.start(FRAME_MS)
         
         self.link_src = None
         self.link_src_belt = None
@@ -74,7 +126,10 @@ class View(QGraphicsView):
         self.scene.addItem(self.generator)
         
         # Active boxes
-        self.boxes = []  # List of dicts: {"item": QGraphicsRectItem, "belt": Belt, "t": float}
+        self.boxes: list[LineBox] = []  # Boxes currently on belts
+        self._belt_box_count = {}  # Belt -> number of boxes in self.boxes on that belt
+        self._cell_occ = {}  # (Belt, cell index) -> number of boxes in that cell
+        self._box_pool: list[QGraphicsRectItem] = []  # Hidden, styled box items ready for reuse
         self.generator_blocked = False  # Wait until downstream is free to spawn next box
         
         # Animation state
@@ -90,10 +145,114 @@ class View(QGraphicsView):
         Returns:
             True if belt has boxes, False otherwise
         """
+        return self._belt_box_count.get(belt, 0) > 0
+    
+    @staticmethod
+    def _cell_of(belt: Belt, t: float) -> int:
+        """Cell index on `belt` for position `t` (0..1 along the belt)."""
+        return int(max(0.0, min(0.999, t)) * belt.width_ticks)
+    
+    @staticmethod
+    def _count_inc(counts: dict, key):
+        counts[key] = counts.get(key, 0) + 1
+    
+    @staticmethod
+    def _count_dec(counts: dict, key):
+        n = counts.get(key, 0) - 1
+        if n > 0:
+            counts[key] = n
+        else:
+            counts.pop(key, None)
+    
+    def _belt_enter(self, belt: Belt):
+        """Count a box onto `belt`; the first one flags the belt as occupied."""
+        self._count_inc(self._belt_box_count, belt)
+        if self._belt_box_count[belt] == 1:
+            belt.has_box = True
+            belt.update_box_indicator()
+    
+    def _belt_leave(self, belt: Belt):
+        """Count a box off `belt`; the last one clears the occupied flag."""
+        self._count_dec(self._belt_box_count, belt)
+        if belt not in self._belt_box_count:
+            belt.has_box = False
+            belt.update_box_indicator()
+    
+    def _sync_has_box(self):
+        """Set every belt's occupancy flag from the box counts (after bulk changes)."""
+        for belt in self.belts:
+            has_box = belt in self._belt_box_count
+            if belt.has_box != has_box:
+                belt.has_box = has_box
+                belt.update_box_indicator()
+    
+    def _take_box_item(self, w: float, h: float) -> QGraphicsRectItem:
+        """Get a visible, styled box item in the scene, reusing a pooled one if possible."""
+        if self._box_pool:
+            item = self._box_pool.pop()
+            item.setRect(0, 0, w, h)
+            item.setVisible(True)
+            return item
+        item = QGraphicsRectItem(0, 0, w, h)
+        item.setBrush(_BOX_BRUSH)
+        item.setPen(_BOX_PEN)
+        self.scene.addItem(item)
+        return item
+    
+    def _release_box_item(self, item: QGraphicsRectItem):
+        """Hide a box item that left the belts and keep it for reuse (up to BOX_POOL_MAX)."""
+        if len(self._box_pool) < BOX_POOL_MAX:
+            item.setVisible(False)
+            self._box_pool.append(item)
+        elif item.scene() is not None:
+            item.scene().removeItem(item)
+    
+    def _add_box(self, item: QGraphicsRectItem, belt: Belt):
+        """Put a new box at the start of a belt and index it."""
+        self.boxes.append(LineBox(item, belt))
+        self._belt_enter(belt)
+        self._count_inc(self._cell_occ, (belt, 0))
+    
+    def _unindex_box(self, bx: LineBox):
+        """Drop a box from the indexes only; the caller removes it from self.boxes."""
+        self._belt_leave(bx.belt)
+        self._count_dec(self._cell_occ, (bx.belt, bx.cell))
+    
+    def _set_box_pos(self, bx: LineBox, belt: Belt, t: float):
+        """Move a box to position `t` on `belt`, keeping the indexes in sync."""
+        old_belt = bx.belt
+        cell = self._cell_of(belt, t)
+        if belt is not old_belt:
+            self._belt_leave(old_belt)
+            self._belt_enter(belt)
+            bx.belt = belt
+        if belt is not old_belt or cell != bx.cell:
+            self._count_dec(self._cell_occ, (old_belt, bx.cell))
+            self._count_inc(self._cell_occ, (belt, cell))
+            bx.cell = cell
+        bx.t = t
+    
+    def _rebuild_box_index(self):
+        """Recompute box counts and cell occupancy from self.boxes.
+        
+        Needed after bulk edits of self.boxes or when a belt's width changes.
+        """
+        self._belt_box_count.clear()
+        self._cell_occ.clear()
         for bx in self.boxes:
-            if bx["belt"] is belt:
-                return True
-        return False
+            belt = bx.belt
+            bx.cell = self._cell_of(belt, bx.t)
+            self._count_inc(self._belt_box_count, belt)
+            self._count_inc(self._cell_occ, (belt, bx.cell))
+        self._sync_has_box()
+    
+    def reset_boxes(self):
+        """Forget all boxes on belts and pooled box items (their items must already be off the scene)."""
+        self.boxes.clear()
+        self._box_pool.clear()
+        self._belt_box_count.clear()
+        self._cell_occ.clear()
+        self._sync_has_box()
     
     def cell_occupied(self, belt: Belt, idx: int) -> bool:
         """Check if the given belt cell index is occupied by any active box.
@@ -105,16 +264,7 @@ class View(QGraphicsView):
         Returns:
             True if cell is occupied, False otherwise
         """
-        try:
-            for bx in self.boxes:
-                if bx.get("belt") is belt:
-                    t_clamped = max(0.0, min(0.999, float(bx.get("t", 0.0))))
-                    cell_idx = int(t_clamped * max(1, getattr(belt, 'width_ticks', 1)))
-                    if cell_idx == int(idx):
-                        return True
-        except Exception:
-            pass
-        return False
+        return self._cell_occ.get((belt, int(idx)), 0) > 0
     
     def add_belt(self, x: float = None, y: float = None, w: float = TICK_PX, h: float = 80, label: str = "Belt"):
         """Add a belt to the scene.
@@ -134,15 +284,19 @@ class View(QGraphicsView):
             x, y = p.x(), p.y()
         
         # Default label if not provided
+        num = None
         if label == "Belt":
-            label = f"Band {self.next_belt_num}"
+            num = self.next_belt_num
+            label = f"Band {num}"
             self.next_belt_num += 1
         
         b = Belt(x, y, w, h, label)
+        b.num = num
         b.resize_for_ticks(b.width_ticks)
         b.bid = self.next_belt_id
         self.next_belt_id += 1
         self.scene.addItem(b)
+        self.belts.append(b)
         
         # Ensure slot visuals are built after the item is in the scene
         if hasattr(b, "_rebuild_slots"):
@@ -167,14 +321,18 @@ class View(QGraphicsView):
             p = self.last_scene_pos if hasattr(self, 'last_scene_pos') else self.sceneRect().center()
             x, y = p.x(), p.y()
         
+        num = None
         if label == "Exit":
-            label = f"Exit {self.next_exit_num}"
+            num = self.next_exit_num
+            label = f"Exit {num}"
             self.next_exit_num += 1
         
         ex = ExitBlock(x, y, w, h, label)
+        ex.num = num
         ex.xid = self.next_exit_id
         self.next_exit_id += 1
         self.scene.addItem(ex)
+        self.exits.append(ex)
         
         # Ensure slot visuals are built after the item is in the scene
         if hasattr(ex, "_rebuild_slots"):
@@ -259,7 +417,9 @@ class View(QGraphicsView):
             end_item = None
             end_parent = None
             end_role = None
-            for it in self.scene.items(scene_pos):
+            # Small box around the cursor: bounding-rect tests only, topmost item first
+            hit_rect = QRectF(scene_pos.x() - 4, scene_pos.y() - 4, 8, 8)
+            for it in self.scene.items(hit_rect, Qt.IntersectsItemBoundingRect, Qt.DescendingOrder):
                 if isinstance(it, BeltPort) and it is not self.link_src:
                     end_item = it
                     end_parent = it.parentItem()
@@ -304,17 +464,13 @@ class View(QGraphicsView):
                 # Compute path between correct ports
                 s = src_obj.p_out.scenePos() if isinstance(src_obj, (Belt, BoxGenerator)) else scene_pos
                 d = dst_obj.p_in.scenePos()
-                p = QPainterPath(s)
-                mid = (s + d) / 2
-                ctrl = QPointF(mid.x(), s.y())
-                p.cubicTo(ctrl, QPointF(mid.x(), d.y()), d)
-                path = QGraphicsPathItem(p)
-                path.setPen(QPen(Qt.darkGreen, 2))
+                path = QGraphicsPathItem(link_curve(s.x(), s.y(), d.x(), d.y()))
+                path.setPen(LINK_PEN)
                 path.setFlag(QGraphicsItem.ItemIsSelectable, True)
                 path.setFlag(QGraphicsItem.ItemIsFocusable, True)
+                path.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
                 self.scene.addItem(path)
                 # Store visual + logical link
-                self.links.append((path, getattr(src_obj, 'p_out', None), dst_obj.p_in))
                 self.links_data.append({
                     "pathItem": path,
                     "src_belt": src_obj,  # may be Belt or BoxGenerator
@@ -324,9 +480,7 @@ class View(QGraphicsView):
                 })
                 path.setToolTip(f"{self._label_of(src_obj)} output -> {self._label_of(dst_obj)} input")
                 # Rebuild downstream cache
-                self._rebuild_downstream()
-                self.refresh_link_tooltips()
-                self.refresh_port_indicators()
+                self.refresh_links()
                 self.anim_path = path.path()
                 self.anim_t = 0.0
             
@@ -372,10 +526,10 @@ class View(QGraphicsView):
         for e in self.links_data:
             pathItem = e["pathItem"]
             if pathItem.isSelected():
-                pathItem.setPen(QPen(Qt.blue, 3, Qt.DashLine))
+                pathItem.setPen(_LINK_SELECTED_PEN)
                 selected_paths.append(pathItem)
             else:
-                pathItem.setPen(QPen(Qt.darkGreen, 2))
+                pathItem.setPen(LINK_PEN)
         # Attach/redraw anim dot on last selected path (if any)
         if selected_paths:
             self.anim_path = selected_paths[-1].path()
@@ -401,13 +555,19 @@ class View(QGraphicsView):
                 self.links_data.remove(e)
         # Remove boxes sitting on selected belts
         if hasattr(self, 'boxes'):
-            self.boxes = [bx for bx in self.boxes if bx.get("belt") not in selected]
+            for bx in self.boxes:
+                if bx.belt in selected:
+                    self._release_box_item(bx.item)
+            self.boxes = [bx for bx in self.boxes if bx.belt not in selected]
+            self._rebuild_box_index()
         # Finally remove the nodes
         for it in selected:
             self.scene.removeItem(it)
-        self._rebuild_downstream()
-        self.refresh_link_tooltips()
-        self.refresh_port_indicators()
+            if it in self.belts:
+                self.belts.remove(it)
+            elif it in self.exits:
+                self.exits.remove(it)
+        self.refresh_links()
         # Update paths to be safe
         self.update_all_link_paths()
     
@@ -435,14 +595,8 @@ class View(QGraphicsView):
                 self.scene.removeItem(pathItem)
             if e in self.links_data:
                 self.links_data.remove(e)
-        # Also prune from legacy self.links if present
-        if hasattr(self, 'links'):
-            dead_paths = {e["pathItem"] for e in to_remove}
-            self.links = [t for t in self.links if t[0] not in dead_paths]
         # Rebuild caches and visuals
-        self._rebuild_downstream()
-        self.refresh_link_tooltips()
-        self.refresh_port_indicators()
+        self.refresh_links()
         self.update_all_link_paths()
     
     def keyPressEvent(self, ev):
@@ -462,24 +616,49 @@ class View(QGraphicsView):
             return
         super().keyPressEvent(ev)
     
+    @staticmethod
+    def _link_path(src_obj, dst_obj) -> QPainterPath:
+        """Build the curved link path from src_obj's output port to dst_obj's input port."""
+        s = src_obj.p_out.scenePos() if hasattr(src_obj, 'p_out') else src_obj.p_in.scenePos()
+        d = dst_obj.p_in.scenePos()
+        return link_curve(s.x(), s.y(), d.x(), d.y())
+    
+    def _mark_links_dirty(self, node):
+        """Queue the links attached to `node` for a path update.
+        
+        Called when a node moved or its ports shifted. All marks made before
+        control returns to the event loop are handled by one flush.
+        """
+        if not self._dirty_links:
+            QTimer.singleShot(0, self._flush_dirty_links)
+        self._dirty_links.add(node)
+    
+    def _flush_dirty_links(self):
+        """Rebuild the paths of links touching a node marked dirty."""
+        dirty = self._dirty_links
+        if not dirty:
+            return
+        self._dirty_links = set()
+        for entry in self.links_data:
+            src_obj = entry["src_belt"]
+            dst_obj = entry["dst_belt"]
+            if src_obj is None or dst_obj is None:
+                continue
+            if src_obj in dirty or dst_obj in dirty:
+                entry["pathItem"].setPath(self._link_path(src_obj, dst_obj))
+    
     def update_all_link_paths(self):
         """Update all link paths."""
         for entry in self.links_data:
-            pathItem = entry["pathItem"]
             src_obj = entry["src_belt"]
             dst_obj = entry["dst_belt"]
             if src_obj is None or dst_obj is None:
                 continue
-            s = src_obj.p_out.scenePos() if hasattr(src_obj, 'p_out') else src_obj.p_in.scenePos()
-            d = dst_obj.p_in.scenePos()
-            p = QPainterPath(s)
-            mid = (s + d) / 2
-            ctrl = QPointF(mid.x(), s.y())
-            p.cubicTo(ctrl, QPointF(mid.x(), d.y()), d)
-            pathItem.setPath(p)
-        self.downstream = []
+            entry["pathItem"].setPath(self._link_path(src_obj, dst_obj))
+        ds = {}
         for e in self.links_data:
-            self.downstream.append((e["src_belt"], e["dst_belt"]))
+            ds.setdefault(e["src_belt"], []).append(e["dst_belt"])
+        self.downstream_map = ds
     
     @staticmethod
     def point_on_path(path: QPainterPath, t: float) -> QPointF:
@@ -492,9 +671,7 @@ class View(QGraphicsView):
         Returns:
             Point on path
         """
-        length = path.length()
-        pos = path.pointAtPercent(t) if length == 0 else path.pointAtPercent(t)
-        return pos
+        return path.pointAtPercent(t)
     
     def _label_of(self, obj) -> str:
         """Get label for an object.
@@ -515,59 +692,77 @@ class View(QGraphicsView):
         # Fallback for any other object types
         return getattr(obj, 'label', str(obj))
     
+    @staticmethod
+    def _link_tooltip(src_name: str, sp: str, dst_name: str, dp: str) -> str:
+        """Tooltip text for a link."""
+        return f"{src_name} {sp} -> {dst_name} {dp}"
+    
+    def _new_conn_map(self) -> dict:
+        """Empty node -> {port role: [link descriptions]} map for all belts and exits."""
+        conn_map = {}
+        for item in self.belts:
+            conn_map[item] = {"input": [], "output": []}
+        for item in self.exits:
+            conn_map[item] = {"input": []}
+        return conn_map
+    
+    @staticmethod
+    def _add_conn(conn_map: dict, src, sp: str, src_name: str, dst, dp: str, dst_name: str):
+        """Record one link on both of its ports in `conn_map`."""
+        if src in conn_map and sp in conn_map[src]:
+            conn_map[src][sp].append(f"→ {dst_name} ({dp})")
+        if dst in conn_map and dp in conn_map[dst]:
+            conn_map[dst][dp].append(f"← {src_name} ({sp})")
+    
     def refresh_link_tooltips(self):
         """Refresh tooltips for all links."""
         for entry in self.links_data:
-            pathItem = entry["pathItem"]
-            src = entry["src_belt"]
-            dst = entry["dst_belt"]
-            src_name = self._label_of(src)
-            dst_name = self._label_of(dst)
-            pathItem.setToolTip(f"{src_name} {entry['src_port']} -> {dst_name} {entry['dst_port']}")
+            entry["pathItem"].setToolTip(self._link_tooltip(
+                self._label_of(entry["src_belt"]), entry["src_port"],
+                self._label_of(entry["dst_belt"]), entry["dst_port"]))
+    
+    @staticmethod
+    def _set_port_indicator(port, links: list, label: str):
+        """Show `port` as linked (green, listing `links`) or open (white).
+        
+        The applied state is remembered on the port, so unchanged ports are
+        not touched again.
+        """
+        if links:
+            state = (True, f"{label}: verbonden met\n" + "\n".join(links))
+        else:
+            state = (False, f"{label}: niet verbonden")
+        if port._indicator == state:
+            return
+        port._indicator = state
+        port.setBrush(_PORT_LINKED_BRUSH if state[0] else _PORT_OPEN_BRUSH)
+        port.setToolTip(state[1])
+    
+    def _apply_port_indicators(self, conn_map: dict):
+        """Apply a node -> {port role: [link descriptions]} map to the port visuals."""
+        for obj, ports in conn_map.items():
+            self._set_port_indicator(obj.p_in, ports["input"], "Input")
+            if "output" in ports:
+                self._set_port_indicator(obj.p_out, ports["output"], "Output")
     
     def refresh_port_indicators(self):
         """Refresh port indicators (connected/disconnected state)."""
-        # Reset ports and tooltips for Belts and Exits
-        white = QBrush(Qt.white)
-        green = QBrush(Qt.green)
-        conn_map = {}
-        for item in self.scene.items():
-            if isinstance(item, Belt):
-                conn_map[item] = {"input": [], "output": []}
-                item.p_in.setBrush(white)
-                item.p_out.setBrush(white)
-                item.p_in.setToolTip("Input: niet verbonden")
-                item.p_out.setToolTip("Output: niet verbonden")
-            elif isinstance(item, ExitBlock):
-                conn_map[item] = {"input": []}
-                item.p_in.setBrush(white)
-                item.p_in.setToolTip("Input: niet verbonden")
-        # Fill connections from links_data
+        conn_map = self._new_conn_map()
         for entry in self.links_data:
             sb = entry["src_belt"]
-            sp = entry["src_port"]
             db = entry["dst_belt"]
-            dp = entry["dst_port"]
-            if sb in conn_map and sp in conn_map[sb]:
-                conn_map[sb][sp].append(f"→ {self._label_of(db)} ({dp})")
-            if db in conn_map and dp in conn_map[db]:
-                conn_map[db][dp].append(f"← {self._label_of(sb)} ({sp})")
-        # Apply visuals and tooltips
-        for obj, ports in conn_map.items():
-            if "input" in ports and ports["input"]:
-                obj.p_in.setBrush(green)
-                obj.p_in.setToolTip("Input: verbonden met\n" + "\n".join(ports["input"]))
-            if isinstance(obj, Belt) and ports.get("output"):
-                obj.p_out.setBrush(green)
-                obj.p_out.setToolTip("Output: verbonden met\n" + "\n".join(ports["output"]))
+            self._add_conn(conn_map, sb, entry["src_port"], self._label_of(sb),
+                           db, entry["dst_port"], self._label_of(db))
+        # Apply visuals and tooltips (only ports whose state changed)
+        self._apply_port_indicators(conn_map)
     
     def _rebuild_downstream(self):
-        """Rebuild cached downstream map (list of (src_obj, dst_obj)).
+        """Rebuild cached downstream map (src_obj -> list of dst_obj).
         
         This is safe to call after deletions; it skips entries whose path or
         endpoints have been removed.
         """
-        ds = []
+        ds = {}
         for e in list(getattr(self, 'links_data', [])):
             src = e.get("src_belt")
             dst = e.get("dst_belt")
@@ -581,38 +776,103 @@ class View(QGraphicsView):
                 continue
             if src is None or dst is None:
                 continue
-            ds.append((src, dst))
-        self.downstream = ds
+            ds.setdefault(src, []).append(dst)
+        self.downstream_map = ds
+    
+    def refresh_links(self):
+        """Rebuild the downstream map, link tooltips and port indicators in one pass.
+        
+        Same result as _rebuild_downstream(), refresh_link_tooltips() and
+        refresh_port_indicators() in turn, but walks links_data once.
+        """
+        label_of = self._label_of
+        names = {}
+        conn_map = self._new_conn_map()
+        ds = {}
+        live = []
+        for e in self.links_data:
+            src = e.get("src_belt")
+            dst = e.get("dst_belt")
+            pathItem = e.get("pathItem")
+            # Drop entries whose visuals were already deleted
+            if pathItem is not None and pathItem.scene() is None:
+                continue
+            live.append(e)
+            if src is None or dst is None:
+                continue
+            ds.setdefault(src, []).append(dst)
+            src_name = names.get(src)
+            if src_name is None:
+                src_name = names[src] = label_of(src)
+            dst_name = names.get(dst)
+            if dst_name is None:
+                dst_name = names[dst] = label_of(dst)
+            sp = e["src_port"]
+            dp = e["dst_port"]
+            if pathItem is not None:
+                pathItem.setToolTip(self._link_tooltip(src_name, sp, dst_name, dp))
+            self._add_conn(conn_map, src, sp, src_name, dst, dp, dst_name)
+        self.links_data[:] = live
+        self.downstream_map = ds
+        self._apply_port_indicators(conn_map)
     
     def clear_line_boxes(self):
         """Remove all boxes that are currently on belts (not inside Exit blocks)."""
         if not hasattr(self, 'boxes') or not self.boxes:
             return
-        for bx in list(self.boxes):
-            itm = bx.get("item")
+        for itm in [bx.item for bx in self.boxes] + self._box_pool:
             if itm is not None:
                 try:
                     self.scene.removeItem(itm)
                 except Exception:
                     pass
-            # Remove from list
-            try:
-                self.boxes.remove(bx)
-            except ValueError:
-                pass
-        # Update belt occupancy indicators
-        for sc_item in self.scene.items():
-            if isinstance(sc_item, Belt):
-                sc_item.has_box = False
-                sc_item.update_box_indicator()
+        self.reset_boxes()
+    
+    def _update_sensors(self):
+        """Derive FT In/Out per belt from cell occupancy and apply only changes.
+
+        FT In is active while a box sits in the first cell, FT Out while a box
+        sits in the last cell. Belts whose sensor state did not change since the
+        previous tick are left untouched, so a manual test pulse from the belt
+        settings dialog is not overwritten; the dialog calls resync_sensors()
+        when the pulse ends so occupancy is re-applied on the next tick.
+        """
+        occ = self._cell_occ
+        for belt in self.belts:
+            state = (occ.get((belt, 0), 0) > 0, occ.get((belt, belt.last_cell), 0) > 0)
+            if state == belt._sensor_state:
+                continue
+            belt._sensor_state = state
+            belt.ft_in_state, belt.ft_out_state = state
+            belt.update_sensor_visual()
+    
+    def _on_frame(self):
+        """Timer slot: run as many fixed simulation steps as real time demands.
+        
+        Elapsed wall time is accumulated and consumed in FRAME_MS steps, so the
+        simulation keeps real-time pace when timer ticks arrive late or
+        bunched up. After a long stall (e.g. a blocking dialog) at most
+        MAX_CATCHUP_STEPS are run and the rest of the backlog is dropped.
+        """
+        now = time.perf_counter()
+        self._accum_ms += (now - self._last_perf) * 1000.0
+        self._last_perf = now
+        steps = int(self._accum_ms // FRAME_MS)
+        if steps > MAX_CATCHUP_STEPS:
+            steps = MAX_CATCHUP_STEPS
+            self._accum_ms %= FRAME_MS
+        else:
+            self._accum_ms -= steps * FRAME_MS
+        for _ in range(steps):
+            self.tick()
     
     def tick(self):
-        """Update simulation state (called by timer)."""
+        """Advance the simulation by one fixed FRAME_MS step."""
         # Update generator timer and possibly spawn a single box only when downstream is free
-        dt_ms = int(16 * self.sim_speed)
+        dt_ms = int(FRAME_MS * self.sim_speed)
         if getattr(self, 'generator', None) is not None:
             # Determine first downstream node from generator (Belt or ExitBlock)
-            next_nodes = [dst for (src, dst) in self.downstream if src is self.generator]
+            next_nodes = self.downstream_map.get(self.generator)
             first_dst = next_nodes[0] if next_nodes else None
             
             # Can we spawn now? (allow multiple boxes on a belt but not in the same cell)
@@ -637,17 +897,10 @@ class View(QGraphicsView):
                     # Fill the cell visually: use dimensions matching the belt cell
                     cell_h = 80 - 28 - 20  # Same as belt's inner band height
                     cell_w = TICK_PX - 16  # Match one tick width minus margins
-                    box_item = QGraphicsRectItem(0, 0, cell_w, cell_h)
-                    box_item.setBrush(QBrush(Qt.blue))
-                    box_item.setPen(QPen(Qt.black, 1))
-                    self.scene.addItem(box_item)
-                    self.boxes.append({"item": box_item, "belt": first_dst, "t": 0.0})
+                    self._add_box(self._take_box_item(cell_w, cell_h), first_dst)
                 elif isinstance(first_dst, ExitBlock):
-                    box_item = QGraphicsRectItem(-7, -5, 14, 10)
-                    box_item.setBrush(QBrush(Qt.blue))
-                    box_item.setPen(QPen(Qt.black, 1))
-                    # Not in self.boxes; exit manages this box
-                    first_dst.add_box(box_item)
+                    # Not in self.boxes; the exit draws its own slot fills
+                    first_dst.add_box(None)
                 self.generator_blocked = False
                 self.generator.blocked = False
                 self.generator.elapsed_ms = 0
@@ -657,17 +910,10 @@ class View(QGraphicsView):
                     if isinstance(first_dst, Belt):
                         cell_h = 80 - 28 - 20  # Same as belt's inner band height
                         cell_w = TICK_PX - 16  # Match one tick width minus margins
-                        box_item = QGraphicsRectItem(0, 0, cell_w, cell_h)
-                        box_item.setBrush(QBrush(Qt.blue))
-                        box_item.setPen(QPen(Qt.black, 1))
-                        self.scene.addItem(box_item)
-                        self.boxes.append({"item": box_item, "belt": first_dst, "t": 0.0})
+                        self._add_box(self._take_box_item(cell_w, cell_h), first_dst)
                         self.generator.elapsed_ms = 0
                     elif isinstance(first_dst, ExitBlock):
-                        box_item = QGraphicsRectItem(-7, -5, 14, 10)
-                        box_item.setBrush(QBrush(Qt.blue))
-                        box_item.setPen(QPen(Qt.black, 1))
-                        first_dst.add_box(box_item)
+                        first_dst.add_box(None)
                         self.generator.elapsed_ms = 0
                 else:
                     # Can't yet -> block until free
@@ -676,95 +922,105 @@ class View(QGraphicsView):
         
         # Move boxes across belts if motor is on
         speed_per_sec = 0.25 * self.sim_speed  # Fraction of belt length per second
-        dt = 0.016 * self.sim_speed
-        for bx in list(self.boxes):
-            belt = bx["belt"]
-            motor_on = VARS.get(belt.motor_var, False) if belt.motor_var else False
-            # Visual indicator + debug log: only update on state change
-            try:
-                prev = getattr(belt, '_motor_on_state', False)
-                if motor_on != prev:
-                    # White when ON, dark gray when OFF
-                    belt.setBrush(QBrush(Qt.white if motor_on else Qt.darkGray))
-                    belt._motor_on_state = motor_on
-            except Exception:
-                pass
-            if motor_on:
+        dt = FRAME_MS / 1000.0 * self.sim_speed
+        # Loop invariants bound to locals once per tick
+        step = speed_per_sec * dt
+        vars_get = VARS.get
+        set_pos = self._set_box_pos
+        cell_occupied = self.cell_occupied
+        # Motor state per belt, read once per tick instead of once per box
+        motor = {}
+        for belt in self.belts:
+            motor_on = bool(vars_get(belt.motor_var, False)) if belt.motor_var else False
+            motor[belt] = motor_on
+            # Visual indicator: only update on state change
+            if motor_on != belt._motor_on_state:
+                # White when ON, dark gray when OFF
+                belt.setBrush(_MOTOR_ON_BRUSH if motor_on else _MOTOR_OFF_BRUSH)
+                belt._motor_on_state = motor_on
+        if not self.boxes:
+            # Empty line (e.g. right after start): nothing to move or snap
+            self._update_sensors()
+            self._tick_exits(dt_ms)
+            return
+        # Scene origin per belt, read once per tick instead of once per box
+        pose = {}
+        for belt in self.belts:
+            origin = belt.scenePos()
+            pose[belt] = (origin.x(), origin.y())
+        # Boxes that stay on the line, collected in one pass (no per-removal list scan)
+        survivors = []
+        for bx in self.boxes:
+            belt = bx.belt
+            if motor.get(belt, False):
                 try:
                     # Prevent moving into an occupied cell: compute current and next cell
-                    width_ticks = max(1, getattr(belt, 'width_ticks', 1))
-                    cur_t = float(bx.get("t", 0.0))
-                    cur_cell = int(max(0.0, min(0.999, cur_t)) * width_ticks)
-                    new_t = cur_t + speed_per_sec * dt
-                    new_cell = int(max(0.0, min(0.999, new_t)) * width_ticks)
-                    if new_cell != cur_cell:
+                    new_t = bx.t + step
+                    new_cell = int(max(0.0, min(0.999, new_t)) * belt.width_ticks)
+                    if new_cell != bx.cell:
                         # Moving into a new cell: only advance if that cell is free
-                        if not self.cell_occupied(belt, new_cell):
-                            bx["t"] = new_t
+                        if not cell_occupied(belt, new_cell):
+                            set_pos(bx, belt, new_t)
                         # Else wait in current cell (do nothing)
                     else:
                         # Still in same cell: advance normally
-                        bx["t"] = new_t
+                        set_pos(bx, belt, new_t)
                 except Exception:
                     # Fallback: safe increment
-                    bx["t"] += speed_per_sec * dt
+                    set_pos(bx, belt, bx.t + step)
             # Reached end?
-            if bx["t"] >= 1.0:
-                downs = [dst for (src, dst) in self.downstream if src is belt]
+            if bx.t >= 1.0:
+                downs = self.downstream_map.get(belt)
                 if downs:
                     next_obj = downs[0]
                     if isinstance(next_obj, Belt):
                         if not self.belt_has_box(next_obj):
-                            bx["belt"] = next_obj
-                            bx["t"] = 0.0
-                            belt = bx["belt"]
+                            set_pos(bx, next_obj, 0.0)
+                            belt = bx.belt
                         else:
-                            bx["t"] = 0.999
+                            set_pos(bx, belt, 0.999)
                     elif isinstance(next_obj, ExitBlock):
                         if next_obj.can_accept():
-                            next_obj.add_box(bx["item"])
-                            self.boxes.remove(bx)
+                            # The exit draws its own slot fills; keep the item for the next spawn
+                            next_obj.add_box(None)
+                            self._release_box_item(bx.item)
+                            self._unindex_box(bx)
                             continue
                         else:
-                            bx["t"] = 0.999
+                            set_pos(bx, belt, 0.999)
                     else:
                         # Unknown destination: hold the box at the end of the belt
-                        bx["t"] = 0.999
+                        set_pos(bx, belt, 0.999)
+                        survivors.append(bx)
                         continue
                 else:
                     # No downstream configured: hold the box at the end of the belt
-                    bx["t"] = 0.999
+                    set_pos(bx, belt, 0.999)
+                    survivors.append(bx)
                     continue
-            # Snap visually to cells (middle band)
-            r = belt.rect()
-            cell_w = (r.width() - 16) / max(1, belt.width_ticks)
-            # Middle band y between 28..(h-20)
-            band_top = 28
-            band_bottom = r.height() - 20
-            t_clamped = max(0.0, min(0.999, bx["t"]))
-            cell_idx = int(t_clamped * belt.width_ticks)
+            # Snap visually to cells (middle band); cell size is cached on the belt
+            cell_w, band_top, band_h = belt.cell_geom
             # For full cell-filling blue box:
-            px = belt.scenePos().x() + 8 + cell_idx * cell_w
-            py = belt.scenePos().y() + band_top
-            bx["item"].setRect(0, 0, cell_w, band_bottom - band_top)
-            bx["item"].setPos(QPointF(px, py))
-            # Update belt FT In/Out states based on current box position
-            if hasattr(belt, 'width_ticks'):
-                tick_idx = int(bx["t"] * belt.width_ticks)
-                belt.ft_in_state = (tick_idx <= 0 and self.belt_has_box(belt))
-                belt.ft_out_state = (tick_idx >= max(0, belt.width_ticks - 1))
-                belt.update_sensor_visual()
-        # Update occupancy indicators on all belts
-        for sc_item in self.scene.items():
-            if isinstance(sc_item, Belt):
-                sc_item.has_box = self.belt_has_box(sc_item)
-                sc_item.update_box_indicator()
-        
-        # Update exit blocks dwell timers
-        for sc_item in self.scene.items():
-            if isinstance(sc_item, ExitBlock):
-                sc_item.tick(int(16 * self.sim_speed))
-        
-        # Optionally: update links as belts move
-        self.update_all_link_paths()
+            ox, oy = pose[belt]
+            px = ox + belt.cell_x[bx.cell]
+            py = oy + band_top
+            # Only touch the item when its geometry actually changed (most frames it doesn't)
+            geom = (px, py, cell_w, band_h)
+            last = bx.geom
+            if geom != last:
+                if last is None or last[2:] != geom[2:]:
+                    bx.item.setRect(0, 0, cell_w, band_h)
+                bx.item.setPos(px, py)
+                bx.geom = geom
+            survivors.append(bx)
+        self.boxes = survivors
+        # Update belt FT In/Out states once per tick, after all boxes moved
+        self._update_sensors()
+        
+        self._tick_exits(dt_ms)
+    
+    def _tick_exits(self, dt_ms: int):
+        """Advance the dwell timers of all exit blocks."""
+        for ex in self.exits:
+            ex.tick(dt_ms)
 
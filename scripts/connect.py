@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import time
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
     from rich.console import Console
+    from rich.live import Live
     from rich.table import Table as RichTable
+    from rich.text import Text
 except Exception:  # pragma: no cover
     Console = None
+    Live = None
     RichTable = None
+    Text = None
+
+# Poll period and reconnect back-off bounds in seconds
+POLL_PERIOD_S = 0.5
+RETRY_MIN_S = 1.0
+RETRY_MAX_S = 16.0
 
 
 def load_project(project_file: str):
@@ -36,6 +46,15 @@ def main():
         return 1
 
     db = S7DataBlock.from_definition_file(path=def_path, db_number=db_number, nesting_depth_to_skip=1)
+    # The definition does not change while running: collect the variable names once
+    names = list(db.data)
+    # Precompiled decoder for all variables, in the same order as `names`
+    plan = db.decode_plan()
+    # Value style per variable follows from its (static) type: packed bools, chars, or numbers
+    kinds = [
+        "bool" if fmt == "H" and isinstance(off, tuple) else ("str" if fmt == "c" else "num")
+        for off, fmt in db.data.values()
+    ]
     client = snap7.client.Client()
 
     console = Console() if Console else None
@@ -43,29 +62,83 @@ def main():
     rack = 0
     slot = 1
 
-    while True:
-        try:
-            if not client.get_connected():
-                client.connect(ip, rack, slot)
-            if client.get_connected():
-                db.buffer = client.db_read(db_number=db.db_number, start=0, size=db.db_size)
-                if console and RichTable:
-                    table = RichTable(title=f"DB{db.db_number} live")
-                    table.add_column("Variable", style="bold")
-                    table.add_column("Value")
-                    for name in db.data.keys():
-                        val = db[name]
-                        style = "green" if isinstance(val, bool) and val else ("red" if isinstance(val, bool) else ("cyan" if isinstance(val, (int, float)) else "white"))
-                        table.add_row(name, f"[{style}]{val}[/]")
-                    console.print(table)
+    # Build the table once; each refresh only rewrites the value cells in place
+    live = None
+    cells = None
+    if console and RichTable:
+        table = RichTable(title=f"DB{db.db_number} live")
+        table.add_column("Variable", style="bold")
+        table.add_column("Value")
+        cells = [Text("") for _ in names]
+        for name, cell in zip(names, cells):
+            table.add_row(name, cell)
+        live = Live(table, console=console, auto_refresh=False)
+        live.start()
+
+    # Plain-text fallback: one dict updated in place, printed only when a value changed
+    out = dict.fromkeys(names)
+
+    def render(values):
+        if cells is not None:
+            for (name, val), kind, cell in zip(values, kinds, cells):
+                if kind == "bool":
+                    style = "green" if val else "red"
                 else:
-                    print(dict((k, db[k]) for k in db.data.keys()))
-            time.sleep(0.5)
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"Error: {e}")
-            time.sleep(1.0)
+                    style = "cyan" if kind == "num" else "white"
+                cell.plain = str(val)
+                cell.style = style
+            live.refresh()
+        else:
+            changed = False
+            for name, val in values:
+                if out[name] != val:
+                    out[name] = val
+                    changed = True
+            if changed:
+                print(out)
+
+    async def poll_loop():
+        # snap7 calls block: run them on one worker thread so the event loop stays free
+        loop = asyncio.get_running_loop()
+        io = ThreadPoolExecutor(max_workers=1)
+        # Poll on a fixed schedule: sleep only what is left of the period after the read
+        next_t = loop.time()
+        backoff = RETRY_MIN_S
+        last_buf = None
+        try:
+            while True:
+                try:
+                    if not client.get_connected():
+                        await loop.run_in_executor(io, client.connect, ip, rack, slot)
+                    if client.get_connected():
+                        buf = await loop.run_in_executor(io, client.db_read, db.db_number, 0, db.db_size)
+                        # Only decode and redraw when the DB contents changed
+                        if buf != last_buf:
+                            last_buf = bytes(buf)
+                            db.buffer = buf
+                            render(db.decode_all(plan))
+                    backoff = RETRY_MIN_S
+                    next_t += POLL_PERIOD_S
+                    now = loop.time()
+                    if next_t < now:
+                        # Fell behind (slow read): restart the schedule instead of bursting to catch up
+                        next_t = now
+                    await asyncio.sleep(next_t - now)
+                except Exception as e:
+                    # Back off 1, 2, 4, ... s between failed attempts
+                    print(f"Error: {e} (retry in {backoff:.0f} s)")
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, RETRY_MAX_S)
+                    next_t = loop.time()
+        finally:
+            io.shutdown(wait=False)
+
+    try:
+        asyncio.run(poll_loop())
+    except KeyboardInterrupt:
+        pass
+    if live is not None:
+        live.stop()
     try:
         client.disconnect()
     except Exception: